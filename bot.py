@@ -3,6 +3,7 @@
 Attributes:
     API_TOKEN (str): The API token for the bot, retrieved from environment variables.
     bot (Bot): An instance of the Bot class, initialized with the API token and default properties.
+        Its requests pass through the rate limit middleware to stay within Telegram limits.
 """
 from aiogram import Bot
 from aiogram.client.default import DefaultBotProperties
@@ -10,10 +11,12 @@ from aiogram.enums.parse_mode import ParseMode
 from decouple import config
 
 from config import logging
+from throttling import RateLimitRequestMiddleware
 
 # Pyright is unable to infer the type of the API_TOKEN variable from the decouple config function.
 API_TOKEN: str = config("API_TOKEN")  # pyright: ignore[reportAssignmentType]
 bot = Bot(token=API_TOKEN, default=DefaultBotProperties(parse_mode=ParseMode.HTML))
+bot.session.middleware(RateLimitRequestMiddleware())
 
 
 async def send_message_to_user(user_id: int, text: str) -> None:
@@ -2,10 +2,12 @@
 
 Attributes:
     redis_client (Redis): Redis client configured with host, port, and database from environment variables.
-    storage (RedisStorage): Redis-based storage for FSM.
+    storage (RedisStorage): Redis-based storage for FSM. The state data is stored as compact UTF-8 JSON.
     i18n_middleware (I18nMiddleware): Middleware for handling internationalization with default locale set to Russian.
 """
+import json
 import logging
+from functools import partial
 from typing import Final
 
 from aiogram.fsm.storage.redis import RedisStorage
@@ -18,7 +20,7 @@ from middleware import LocaleManager
 
 logging.basicConfig(level=logging.ERROR)
 
-LANGUAGES: Final = {"ru": "Русский", "en": "English"}  # noqa: WPS407
+LANGUAGES: Final = {"en": "English", "ru": "Русский"}  # noqa: WPS407
 
 # Pyright is unable to infer the type of the API_TOKEN variable from the decouple config function.
 redis_client = Redis(
@@ -29,7 +31,12 @@ redis_client = Redis(
 )
 
 
-storage = RedisStorage(redis=redis_client)
+# The state data holds the selected category names, expense names and currencies, mostly non-ASCII text: without
+# the escaping and the whitespace of the default json.dumps every FSM write sends fewer bytes to Redis.
+storage = RedisStorage(
+    redis=redis_client,
+    json_dumps=partial(json.dumps, ensure_ascii=False, separators=(",", ":")),
+)
 
 i18n_middleware = I18nMiddleware(
     core=FluentRuntimeCore(
@@ -1,8 +1,11 @@
 """CRUD operations for the Expense model."""
+from collections.abc import Collection
 from datetime import date
+from decimal import Decimal
 
+from sqlalchemy import Numeric, Select, cast
 from sqlalchemy.orm import selectinload
-from sqlalchemy.sql import select
+from sqlalchemy.sql import func, select, true
 
 from database.config import async_session_maker
 from database.crud.categories import user_category_exist_by_id
@@ -105,3 +108,41 @@ async def get_all_currencies_used_by_tg_id(tg_id: int) -> list[str] | None:
         query = select(Expense.currency).where(Expense.user_tg_id == tg_id).distinct()
         query_result = await session.execute(query)
         return [row[0] for row in query_result.all()]
+
+
+async def get_category_currency_sums_by_tg_id(
+    tg_id: int,
+    start_date: date,
+    end_date: date,
+    category_ids: Collection[int] | None = None,
+) -> list[tuple[int, str, Decimal]]:
+    """Retrieve the sums of a user's expenses within a date range grouped by category and currency.
+
+    The aggregation is done by the database, so only one row per category and currency is loaded
+    instead of every expense of the user. The amounts are summed as numerics, so the sums are exact
+    decimals without the rounding errors accumulated by adding floats.
+
+    Args:
+        tg_id (int): The Telegram ID of the user whose expenses are summed.
+        start_date (date): The first date of the range, inclusive.
+        end_date (date): The last date of the range, inclusive.
+        category_ids (Collection[int] | None, optional): The IDs of the categories to sum the expenses of.
+            If None, the expenses of all the user's categories are summed.
+
+    Returns:
+        list[tuple[int, str, Decimal]]: A list of (category ID, currency, sum of amounts) tuples
+            ordered by category ID and currency.
+    """
+    # true() keeps the optional category filter inside the single statement
+    category_filter = true() if category_ids is None else Expense.category_id.in_(category_ids)
+    period_filter = Expense.date.between(start_date, end_date)
+    amount_sum = func.sum(cast(Expense.amount, Numeric()))
+    query: Select[tuple[int, str, Decimal]] = (
+        select(Expense.category_id, Expense.currency, amount_sum)
+        .where(Expense.user_tg_id == tg_id, period_filter, category_filter)  # noqa: WPS348
+        .group_by(Expense.category_id, Expense.currency)  # noqa: WPS348
+        .order_by(Expense.category_id, Expense.currency)  # noqa: WPS348
+    )
+    async with async_session_maker() as session:
+        query_result = await session.execute(query)
+        return [(category_id, currency, total) for category_id, currency, total in query_result.all()]
@@ -13,6 +13,7 @@ from aiogram import Dispatcher
 from bot import bot
 from config import i18n_middleware, storage
 from handlers.add_expense.handler import add_expense_router
+from handlers.basic.current_page_handler import current_page_router
 from handlers.basic.default_handler import default_router
 from handlers.basic.start_handler import start_router
 from handlers.registration.handler import registration_router
@@ -29,6 +30,9 @@ from handlers.statistics_menu.month_statistics.handler import month_statistics_r
 dp = Dispatcher(bot=bot, storage=storage)
 i18n_middleware.setup(dp)
 
+# state-independent routers
+dp.include_router(current_page_router)
+
 # start routers
 dp.include_router(start_router)
 dp.include_router(registration_router)
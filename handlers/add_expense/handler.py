@@ -1,15 +1,17 @@
 """Module contains the handler functions for adding an expense in the expense tracking bot."""
 from aiogram import F, Router, types  # noqa: WPS347
 from aiogram.fsm.context import FSMContext
-from aiogram_i18n import I18nContext, LazyProxy
+from aiogram_i18n import I18nContext
 
 from handlers.add_expense.states import AddExpenseStatesGroup
 from handlers.basic.states import start_menu
 from handlers.error_utils import handle_error_situation
+from handlers.filters import LocalizedTextFilter
 from handlers.handlers_utils import (
     NavigationCallbackData,
     SelectedCategory,
     get_categories_inline_keyboard_and_total_pages,
+    get_category_name,
     get_confirmation_inline_keyboard_markup,
 )
 from handlers.keyboards import get_menu_keyboard, get_post_menu_keyboard
@@ -17,6 +19,8 @@ from services.expenses_service import ExpenseNotAddedError, add_expense
 from services.user_configs_service import get_currency_by_tg_id
 
 add_expense_router: Router = Router()
+
+ADD_EXPENSE_BUTTON_FILTER = LocalizedTextFilter("ADD_EXPENSE_BUTTON")
 MAXIMUM_EXPENSE_AMOUNT = 1000000
 
 ADD_EXPENSE_CALLBACK_CATEGORY_DATA = NavigationCallbackData(
@@ -25,7 +29,7 @@ ADD_EXPENSE_CALLBACK_CATEGORY_DATA = NavigationCallbackData(
 )
 
 
-@add_expense_router.message(start_menu, F.text == LazyProxy("ADD_EXPENSE_BUTTON"))
+@add_expense_router.message(start_menu, ADD_EXPENSE_BUTTON_FILTER)
 async def handle_add_expense(message: types.Message, state: FSMContext, i18n: I18nContext) -> None:
     """Handle the addition of an expense by the user.
 
@@ -45,7 +49,7 @@ async def handle_add_expense(message: types.Message, state: FSMContext, i18n: I1
             message=message,
             state=state,
             i18n=i18n,
-            answer_text=i18n.get("ERROR_USER_INFO"),
+            answer_key="ERROR_USER_INFO",
             ensure_safe_exit=_ensure_safe_exit,
         )
         return
@@ -57,7 +61,7 @@ async def handle_add_expense(message: types.Message, state: FSMContext, i18n: I1
             message=message,
             state=state,
             i18n=i18n,
-            answer_text=i18n.get("ERROR_USER_CURRENCY"),
+            answer_key="ERROR_USER_CURRENCY",
             ensure_safe_exit=_ensure_safe_exit,
         )
         return
@@ -86,7 +90,7 @@ async def handle_amount(message: types.Message, state: FSMContext, i18n: I18nCon
             message=message,
             state=state,
             i18n=i18n,
-            answer_text=i18n.get("ERROR_USER_INFO"),
+            answer_key="ERROR_USER_INFO",
             ensure_safe_exit=_ensure_safe_exit,
         )
         return
@@ -96,7 +100,7 @@ async def handle_amount(message: types.Message, state: FSMContext, i18n: I18nCon
             message=message,
             state=state,
             i18n=i18n,
-            answer_text=i18n.get("ERROR_AMOUNT_NOT_VALID"),
+            answer_key="ERROR_AMOUNT_NOT_VALID",
             ensure_safe_exit=_ensure_safe_exit,
         )
         return
@@ -106,7 +110,7 @@ async def handle_amount(message: types.Message, state: FSMContext, i18n: I18nCon
             message=message,
             state=state,
             i18n=i18n,
-            answer_text=i18n.get("ERROR_AMOUNT_NOT_VALID"),
+            answer_key="ERROR_AMOUNT_NOT_VALID",
             ensure_safe_exit=_ensure_safe_exit,
         )
         return
@@ -132,7 +136,7 @@ async def handle_name(message: types.Message, state: FSMContext, i18n: I18nConte
             message=message,
             state=state,
             i18n=i18n,
-            answer_text=i18n.get("ERROR_USER_INFO"),
+            answer_key="ERROR_USER_INFO",
             ensure_safe_exit=_ensure_safe_exit,
         )
         return
@@ -148,7 +152,7 @@ async def handle_name(message: types.Message, state: FSMContext, i18n: I18nConte
             message=message,
             state=state,
             i18n=i18n,
-            answer_text=i18n.get("ERROR_NO_CATEGORIES"),
+            answer_key="ERROR_NO_CATEGORIES",
             ensure_safe_exit=_ensure_safe_exit,
         )
         return
@@ -177,12 +181,9 @@ async def next_page_button_handler(callback_query: types.CallbackQuery, state: F
     state_data = await state.get_data()
     current_page = state_data.get("current_page_category", 0)
     last_page = state_data.get("last_page_category", 0)
-    if current_page == last_page:
-        await state.update_data(current_page_category=0)
-    else:
-        await state.update_data(current_page_category=current_page + 1)
-
-    await _handle_categories_list(user_id, callback_query.message, state)
+    new_page = 0 if current_page == last_page else current_page + 1
+    await state.update_data(current_page_category=new_page)
+    await _handle_categories_list(user_id, callback_query.message, new_page)
 
 
 @add_expense_router.callback_query(F.data == "prev_page", AddExpenseStatesGroup.selecting_category)
@@ -203,13 +204,9 @@ async def prev_page_button_handler(callback_query: types.CallbackQuery, state: F
     state_data = await state.get_data()
     current_page = state_data.get("current_page_category", 0)
     last_page = state_data.get("last_page_category", 0)
-
-    if current_page == 0:
-        await state.update_data(current_page_category=last_page)
-    else:
-        await state.update_data(current_page_category=current_page - 1)
-
-    await _handle_categories_list(user_id, callback_query.message, state)
+    new_page = last_page if current_page == 0 else current_page - 1
+    await state.update_data(current_page_category=new_page)
+    await _handle_categories_list(user_id, callback_query.message, new_page)
 
 
 @add_expense_router.callback_query(AddExpenseStatesGroup.selecting_category, F.data.not_contains("page"))
@@ -228,23 +225,32 @@ async def handle_category(callback_query: types.CallbackQuery, state: FSMContext
             message=callback_query.message,
             state=state,
             i18n=i18n,
-            answer_text=i18n.get("ERROR_USER_INFO"),
+            answer_key="ERROR_USER_INFO",
+            ensure_safe_exit=_ensure_safe_exit,
+        )
+        return
+    try:
+        category_id = SelectedCategory.unpack_category_id(callback_query.data)
+    except ValueError:
+        await handle_error_situation(
+            message=callback_query.message,
+            state=state,
+            i18n=i18n,
+            answer_key="ERROR_UNKNOWN",
             ensure_safe_exit=_ensure_safe_exit,
         )
         return
-    callback_data = SelectedCategory.unpack(callback_query.data)
-    category_id = callback_data.category_id
-    category_name = callback_data.category_name
+    category_name = await get_category_name(callback_query.from_user.id, category_id)
     state_data = await state.get_data()
     expense_name = state_data.get("name")
     amount = state_data.get("amount")
     currency = state_data.get("currency")
-    if not (expense_name and amount):
+    if not (expense_name and amount and category_name):
         await handle_error_situation(
             message=callback_query.message,
             state=state,
             i18n=i18n,
-            answer_text=i18n.get("ERROR_UNKNOWN"),
+            answer_key="ERROR_UNKNOWN",
             ensure_safe_exit=_ensure_safe_exit,
         )
         return
@@ -283,7 +289,7 @@ async def handle_confirmation(callback_query: types.CallbackQuery, state: FSMCon
             message=callback_query.message,
             state=state,
             i18n=i18n,
-            answer_text=i18n.get("ERROR_USER_INFO"),
+            answer_key="ERROR_USER_INFO",
             ensure_safe_exit=_ensure_safe_exit,
         )
         return
@@ -293,11 +299,9 @@ async def handle_confirmation(callback_query: types.CallbackQuery, state: FSMCon
     await _handle_confirm(callback_query, state, i18n)
 
 
-async def _handle_categories_list(user_id: int, message: types.Message, state: FSMContext) -> None:
+async def _handle_categories_list(user_id: int, message: types.Message, current_page: int) -> None:
     if not message.from_user:
         return
-    state_data = await state.get_data()
-    current_page = state_data.get("current_page_category") or 0
     inline_keyboard_markup, _ = await get_categories_inline_keyboard_and_total_pages(  # noqa: VNE003
         user_id,
         page=current_page,
@@ -355,7 +359,7 @@ async def _handle_confirm(callback_query: types.CallbackQuery, state: FSMContext
             message=callback_query.message,
             state=state,
             i18n=i18n,
-            answer_text=i18n.get("ERROR_UNKNOWN"),
+            answer_key="ERROR_UNKNOWN",
             ensure_safe_exit=_ensure_safe_exit,
         )
         return
@@ -373,7 +377,7 @@ async def _handle_confirm(callback_query: types.CallbackQuery, state: FSMContext
             message=callback_query.message,
             state=state,
             i18n=i18n,
-            answer_text=i18n.get("ERROR_EXPENSE_NOT_ADDED"),
+            answer_key="ERROR_EXPENSE_NOT_ADDED",
             ensure_safe_exit=_ensure_safe_exit,
         )
         return
@@ -0,0 +1,27 @@
+"""Module defines the handler for presses on the current page button of paginated inline keyboards.
+
+Attributes:
+    current_page_router (Router): An instance of aiogram's Router used to register the callback query handler.
+    CURRENT_PAGE_ANSWER_CACHE_TIME (int): Time in seconds for which Telegram clients cache the empty answer.
+"""
+from aiogram import F, Router, types  # noqa: WPS347
+
+from handlers.handlers_utils import CURRENT_PAGE_CALLBACK_DATA
+
+current_page_router: Router = Router()
+
+CURRENT_PAGE_ANSWER_CACHE_TIME = 86400
+
+
+@current_page_router.callback_query(F.data == CURRENT_PAGE_CALLBACK_DATA)
+async def current_page_button_handler(callback_query: types.CallbackQuery) -> None:
+    """Answer a press on the current page button without doing anything.
+
+    The button only displays the page number. Answering it stops the loading indicator,
+    and the cache time lets the client reuse the empty answer for repeated presses
+    instead of sending a new update each time.
+
+    Args:
+        callback_query (types.CallbackQuery): The callback query sent by the current page button.
+    """
+    await callback_query.answer(cache_time=CURRENT_PAGE_ANSWER_CACHE_TIME)
@@ -29,7 +29,7 @@ async def handle_all_other_messages(message: Message, state: FSMContext, i18n: I
         i18n (I18nContext): The internationalization context for retrieving localized messages.
     """
     if message.from_user is None:
-        await handle_error_situation(message, state, i18n, i18n.get("ERROR_USER_INFO"))
+        await handle_error_situation(message, state, i18n, "ERROR_USER_INFO")
         return
     await state.clear()
     await message.answer(i18n.get("COMMAND_NOT_RECOGNIZED"), reply_markup=get_menu_keyboard(i18n))
@@ -1,19 +1,22 @@
 """Module defines the start handler for the Telegram bot using the aiogram framework."""
-from aiogram import F, Router, types  # noqa: WPS347
+from aiogram import Router, types
 from aiogram.filters import Command
 from aiogram.fsm.context import FSMContext
-from aiogram_i18n import I18nContext, LazyProxy
+from aiogram_i18n import I18nContext
 
 from handlers.basic.states import start_menu
 from handlers.error_utils import handle_error_situation
+from handlers.filters import LocalizedTextFilter
 from handlers.keyboards import get_menu_keyboard
 from handlers.registration.handler import start_registration
 from services.user_configs_service import user_config_exist_by_tg_id
 
 start_router: Router = Router()
 
+MAIN_MENU_BUTTON_FILTER = LocalizedTextFilter("MAIN_MENU_BUTTON")
 
-@start_router.message(F.text == LazyProxy("MAIN_MENU_BUTTON"))
+
+@start_router.message(MAIN_MENU_BUTTON_FILTER)
 @start_router.message(Command("start"))
 async def cmd_start(message: types.Message, state: FSMContext, i18n: I18nContext) -> None:
     """Handle the /start command.
@@ -28,7 +31,7 @@ async def cmd_start(message: types.Message, state: FSMContext, i18n: I18nContext
         i18n (I18nContext): The internationalization context for managing translations.
     """
     if message.from_user is None:
-        await handle_error_situation(message, state, i18n, i18n.get("ERROR_USER_INFO"))
+        await handle_error_situation(message, state, i18n, "ERROR_USER_INFO")
         return
     if not await user_config_exist_by_tg_id(message.from_user.id):
         await message.answer(
@@ -3,7 +3,7 @@
 It includes functions to safely retrieve state data or message text, and handle error situations
 by sending appropriate messages to the user and ensuring a safe exit from the current state.
 """
-from typing import Protocol
+from typing import Any, Protocol
 
 from aiogram.fsm.context import FSMContext
 from aiogram.types import Message
@@ -31,7 +31,7 @@ async def get_state_field_or_send_error(
     state: FSMContext,
     i18n: I18nContext,
     field: str,
-    error_text: str,
+    error_key: str,
     ensure_safe_exit: SafeExitProtocol,
 ) -> str | None:
     """Retrieve a specific field from the state data or send an error message if the field is not found.
@@ -41,7 +41,7 @@ async def get_state_field_or_send_error(
         state (FSMContext): The finite state machine context.
         i18n (I18nContext): The internationalization context for localization.
         field (str): The field name to retrieve from the state data.
-        error_text (str): The error message to send if the field is not found.
+        error_key (str): The i18n key of the error message to send if the field is not found.
         ensure_safe_exit (SafeExitProtocol): Protocol to ensure safe exit in case of an error.
 
     Returns:
@@ -50,7 +50,7 @@ async def get_state_field_or_send_error(
     state_data = await state.get_data()
     state_data_value = state_data.get(field)
     if not state_data_value:
-        await handle_error_situation(message, state, i18n, error_text, ensure_safe_exit)
+        await handle_error_situation(message, state, i18n, error_key, ensure_safe_exit)
         return None
     return state_data_value
 
@@ -59,7 +59,7 @@ async def get_text_or_send_error(
     message: Message,
     state: FSMContext,
     i18n: I18nContext,
-    error_text: str,
+    error_key: str,
     ensure_safe_exit: SafeExitProtocol,
 ) -> str | None:
     """Asynchronously retrieves the text from a message or sends an error if the text is not present.
@@ -68,14 +68,14 @@ async def get_text_or_send_error(
         message (Message): The message object containing the text.
         state (FSMContext): The finite state machine context.
         i18n (I18nContext): The internationalization context.
-        error_text (str): The error message to be sent if the text is not present.
+        error_key (str): The i18n key of the error message to be sent if the text is not present.
         ensure_safe_exit (SafeExitProtocol): Protocol to ensure safe exit in case of an error.
 
     Returns:
         (str | None): The text from the message if present, otherwise None.
     """
     if not message.text:
-        await handle_error_situation(message, state, i18n, error_text, ensure_safe_exit)
+        await handle_error_situation(message, state, i18n, error_key, ensure_safe_exit)
         return None
     return message.text
 
@@ -84,18 +84,23 @@ async def handle_error_situation(
     message: Message,
     state: FSMContext,
     i18n: I18nContext,
-    answer_text: str,
+    answer_key: str,
     ensure_safe_exit: SafeExitProtocol | None = None,
+    **answer_kwargs: Any,  # noqa: ANN401
 ) -> None:
     """Handle error situations by sending an appropriate message to the user and optionally ensuring a safe exit.
 
+    The answer is passed as an i18n key and is only resolved here, so the callers do not
+    have to build the localized text themselves.
+
     Args:
         message (Message): The message object containing information about the user and the message.
         state (FSMContext): The finite state machine context for managing user states.
         i18n (I18nContext): The internationalization context for retrieving localized strings.
-        answer_text (str): The text to be sent as a response to the user.
+        answer_key (str): The i18n key of the text to be sent as a response to the user.
         ensure_safe_exit (SafeExitProtocol | None, optional):
             An optional protocol to ensure a safe exit from the current state. Defaults to None.
+        **answer_kwargs (Any): The arguments to format the response text with.
     """
     if not message.from_user:
         if ensure_safe_exit:
@@ -107,4 +112,5 @@ async def handle_error_situation(
         return
     if ensure_safe_exit:
         await ensure_safe_exit(state)
+    answer_text = i18n.get(answer_key, **answer_kwargs)
     await message.answer(answer_text, reply_markup=get_menu_keyboard(i18n))
@@ -0,0 +1,77 @@
+"""Module provides custom aiogram filters used by the bot routers.
+
+Attributes:
+    CATEGORY_END_BUTTON_FILTER (LocalizedTextFilter): Filter matching the "finish category input" button text.
+    SELECTED_CATEGORY_FILTER (MagicFilter): Filter matching callback data of a packed SelectedCategory.
+"""
+from aiogram import F  # noqa: WPS347
+from aiogram.filters import BaseFilter
+from aiogram.types import CallbackQuery, Message
+
+from config import LANGUAGES, i18n_middleware
+from handlers.handlers_utils import SelectedCategory
+
+
+class LocalizedTextFilter(BaseFilter):
+    """Filter that matches a message whose text equals the translation of a key in any supported locale.
+
+    Unlike ``F.text == LazyProxy(key)``, the translations are resolved only once, on the first check,
+    and every following check is a single membership test on a frozenset.
+
+    Attributes:
+        key (str): The i18n key of the text to match.
+    """
+
+    def __init__(self, key: str) -> None:
+        """Initialize the filter with the i18n key of the text to match.
+
+        Args:
+            key (str): The i18n key of the text to match.
+        """
+        self.key = key
+        self._texts: frozenset[str] | None = None
+
+    async def __call__(self, message: Message) -> bool:  # type: ignore[mutable-override]  # noqa: WPS610
+        """Check whether the message text is one of the translations of the key.
+
+        Args:
+            message (Message): The incoming message.
+
+        Returns:
+            bool: True if the message text matches the translation of the key in any locale, False otherwise.
+        """
+        if self._texts is None:
+            get_translation = i18n_middleware.core.get
+            self._texts = frozenset(get_translation(self.key, locale) for locale in LANGUAGES)
+        return message.text in self._texts
+
+
+class CallbackMessageFilter(BaseFilter):
+    """Filter that matches a callback query whose message is still accessible and passes it to the handler.
+
+    Attached to a router, it replaces the ``isinstance(callback_query.message, Message)`` check every
+    callback handler of the router would otherwise start with. The handlers receive the narrowed
+    message as ``message``.
+    """
+
+    async def __call__(  # type: ignore[mutable-override]  # noqa: WPS610
+        self,
+        callback_query: CallbackQuery,
+    ) -> bool | dict[str, Message]:
+        """Check whether the callback query message is an accessible message.
+
+        Args:
+            callback_query (CallbackQuery): The incoming callback query.
+
+        Returns:
+            bool | dict[str, Message]: The message to pass to the handler, or False if it is inaccessible.
+        """
+        if isinstance(callback_query.message, Message):
+            return {"message": callback_query.message}
+        return False
+
+
+CATEGORY_END_BUTTON_FILTER = LocalizedTextFilter("CATEGORY_END_BUTTON")
+
+# A single prefix check instead of unpacking the callback data or excluding every other callback.
+SELECTED_CATEGORY_FILTER = F.data.startswith(f"{SelectedCategory.__prefix__}{SelectedCategory.__separator__}")
@@ -1,20 +1,47 @@
 """Utility functions for handling user input in some handlers process."""
 from dataclasses import dataclass
+from functools import cache, lru_cache
+from itertools import batched
 
 from aiogram import types
 from aiogram.filters.callback_data import CallbackData
 from aiogram.fsm.context import FSMContext
 from aiogram_i18n import I18nContext
 
+from config import i18n_middleware
 from handlers.error_utils import SafeExitProtocol, handle_error_situation
 from handlers.keyboards import get_add_categories_keyboard
 from services.user_configs_service import CategoryData, get_user_expenses_categories
 
 MAXIMUM_CATEGORIES_PER_ROW = 2
 MAXIMUM_CATEGORIES_PER_PAGE = 6
+MAXIMUM_CATEGORY_NAME_LENGTH = 32
+MAXIMUM_CATEGORIES_PER_INPUT = 50
+CURRENT_PAGE_CALLBACK_DATA = "current_page"
+CONFIRMATION_CALLBACK_DATA = frozenset(("confirm", "cancel"))
+CATEGORIES_KEYBOARDS_CACHE_SIZE = 1024
+STATIC_TEXTS_CACHE_SIZE = 512
+NAVIGATION_KEYBOARDS_CACHE_SIZE = 1024
 
+# Maps (confirm key, cancel key, locale) to the confirmation markup built for them.
+_confirmation_markups: dict[tuple[str, str, str], types.InlineKeyboardMarkup] = {}
 
-@dataclass
+
+@lru_cache(maxsize=STATIC_TEXTS_CACHE_SIZE)
+def get_static_text(key: str, locale: str) -> str:
+    """Retrieve a localized text without placeholders, resolving it only once per locale.
+
+    Args:
+        key (str): The i18n key of the text.
+        locale (str): The locale to translate the text to, usually ``i18n.locale``.
+
+    Returns:
+        str: The localized text.
+    """
+    return i18n_middleware.core.get(key, locale)
+
+
+@dataclass(frozen=True)
 class NavigationCallbackData:
     """Class to represent navigation callback data for handling pagination and navigation.
 
@@ -26,17 +53,65 @@ class NavigationCallbackData:
     next_page: str
     prev_page: str
 
+    @property
+    def callback_data(self) -> frozenset[str]:
+        """frozenset[str]: The callback data of both navigation buttons, to match them with a single filter."""
+        return frozenset((self.next_page, self.prev_page))
+
 
 class SelectedCategory(CallbackData, prefix="category"):
     """ChoosenCategory is a data class that represents a chosen category in the expense tracking bot.
 
+    Only the category ID is packed: Telegram limits callback data to 64 bytes, which a long
+    non-latin category name alone may exceed. Use `get_category_name` to resolve the name.
+
     Attributes:
         category_id (int): The unique identifier for the category.
-        category_name (str): The name of the category.
     """
 
     category_id: int
-    category_name: str
+
+    @classmethod
+    def unpack_category_id(cls, callback_data: str) -> int:
+        """Return the category ID packed into the callback data.
+
+        The packed format is fixed (``category:<id>``), so the callback data is split directly
+        instead of going through ``unpack`` and the pydantic validation of the whole model.
+        Buttons sent by older versions also packed the category name (``category:<id>:<name>``),
+        which is ignored.
+
+        Args:
+            callback_data (str): The packed callback data.
+
+        Returns:
+            int: The category ID.
+
+        Raises:
+            ValueError: If the callback data is not a packed SelectedCategory.
+        """
+        prefix, separator, category_id = callback_data.partition(cls.__separator__)
+        if prefix != cls.__prefix__ or not separator:
+            raise ValueError(f"Bad prefix ({prefix!r} != {cls.__prefix__!r})")
+        return int(category_id.partition(cls.__separator__)[0])
+
+
+async def get_category_name(tg_id: int, category_id: int) -> str | None:
+    """Resolve the name of a user's category by its ID.
+
+    The lookup goes through the cached user categories, so it usually does not hit the database.
+
+    Args:
+        tg_id (int): The Telegram ID of the user.
+        category_id (int): The ID of the category.
+
+    Returns:
+        str | None: The name of the category, or None if the user has no such category.
+    """
+    user_categories = await get_user_expenses_categories(tg_id) or []
+    return next(
+        (category_name for category_name, user_category_id in user_categories if user_category_id == category_id),
+        None,
+    )
 
 
 async def add_category_handler(
@@ -48,8 +123,10 @@ async def add_category_handler(
     """Handle the addition of a new category from the user's message.
 
     This function retrieves the new category from the user's message, checks if it is valid,
-    and then updates the state with the new category. If the new category is not valid, it
-    handles the error situation appropriately.
+    and then updates the state with the new category. If the new category is missing, it
+    handles the error situation appropriately. If the category name is too long or too many
+    categories were already entered, the user is asked to correct the input before anything
+    is written to the state.
 
     Args:
         message (types.Message): The message object containing the user's input.
@@ -63,10 +140,22 @@ async def add_category_handler(
     """
     new_category = message.text
     if not new_category:
-        await handle_error_situation(message, state, i18n, i18n.get("ERROR_CATEGORIES"), ensure_safe_exit)
+        await handle_error_situation(message, state, i18n, "ERROR_CATEGORIES", ensure_safe_exit)
+        return
+    if len(new_category) > MAXIMUM_CATEGORY_NAME_LENGTH:
+        await message.answer(
+            i18n.get("ERROR_CATEGORY_NAME_NOT_VALID", max_length=MAXIMUM_CATEGORY_NAME_LENGTH),
+            reply_markup=get_add_categories_keyboard(i18n),
+        )
         return
     state_data = await state.get_data()
-    categories = state_data.get("categories", [])
+    categories = state_data.get("categories") or []
+    if len(categories) >= MAXIMUM_CATEGORIES_PER_INPUT:
+        await message.answer(
+            i18n.get("ERROR_TOO_MANY_CATEGORIES", max_categories=MAXIMUM_CATEGORIES_PER_INPUT),
+            reply_markup=get_add_categories_keyboard(i18n),
+        )
+        return
     categories.append(new_category)
     await state.update_data(categories=categories)
     await message.answer(
@@ -100,16 +189,30 @@ async def get_categories_inline_keyboard_and_total_pages(  # noqa: WPS118, FNE00
     user_categories: list[CategoryData] | None = await get_user_expenses_categories(tg_id)
     if not user_categories:
         return None, None
-    total_pages = _get_total_category_pages(user_categories)
-    user_categories = _paginate_categories(user_categories, page)
+    paginated_categories, total_pages = _paginate_categories(user_categories, page)
     return _get_categories_inline_keyboard_markup(
-        user_categories,
+        tuple(paginated_categories),
         page,
         total_pages,
         navigation_callback_data,
     ), total_pages
 
 
+async def get_categories_total_pages(tg_id: int) -> int:
+    """Return the number of pages the user's categories take in the categories inline keyboard.
+
+    Args:
+        tg_id (int): The Telegram user ID.
+
+    Returns:
+        int: The total number of pages, 0 if the user has no categories.
+    """
+    user_categories: list[CategoryData] | None = await get_user_expenses_categories(tg_id)
+    if not user_categories:
+        return 0
+    return _count_categories_pages(len(user_categories))
+
+
 def get_confirmation_inline_keyboard_markup(
     confirm_i18n_text: str,
     cancel_i18n_text: str,
@@ -117,6 +220,9 @@ def get_confirmation_inline_keyboard_markup(
 ) -> types.InlineKeyboardMarkup:
     """Create an inline keyboard markup with two buttons: one for confirmation and one for cancellation.
 
+    The markup depends only on the button keys and the locale, so it is built once per combination
+    and shared between all users.
+
     Args:
         confirm_i18n_text (str): The key for the confirmation button text in the i18n context.
         cancel_i18n_text (str): The key for the cancellation button text in the i18n context.
@@ -125,59 +231,71 @@ def get_confirmation_inline_keyboard_markup(
     Returns:
         types.InlineKeyboardMarkup: An inline keyboard markup containing the confirmation and cancellation buttons.
     """
-    return types.InlineKeyboardMarkup(
-        inline_keyboard=[
-            [
-                types.InlineKeyboardButton(
-                    text=i18n.get(confirm_i18n_text),
-                    callback_data="confirm",
-                ),
-                types.InlineKeyboardButton(
-                    text=i18n.get(cancel_i18n_text),
-                    callback_data="cancel",
-                ),
+    cache_key = (confirm_i18n_text, cancel_i18n_text, i18n.locale)
+    confirmation_markup = _confirmation_markups.get(cache_key)
+    if confirmation_markup is None:
+        confirmation_markup = types.InlineKeyboardMarkup(
+            inline_keyboard=[
+                [
+                    types.InlineKeyboardButton(
+                        text=i18n.get(confirm_i18n_text),
+                        callback_data="confirm",
+                    ),
+                    types.InlineKeyboardButton(
+                        text=i18n.get(cancel_i18n_text),
+                        callback_data="cancel",
+                    ),
+                ],
             ],
-        ],
-    )
+        )
+        _confirmation_markups[cache_key] = confirmation_markup
+    return confirmation_markup
 
 
-def _get_total_category_pages(categories: list[CategoryData]) -> int:
-    """Calculate the total number of pages required to display all categories.
+def _paginate_categories(categories: list[CategoryData], page: int) -> tuple[list[CategoryData], int]:
+    """Paginate a list of categories and count the total number of pages in one pass.
 
     Args:
-        categories (list[CategoryData]): A list of category data objects.
+        categories (list[CategoryData]): The list of categories to paginate.
+        page (int): The page number to retrieve.
 
     Returns:
-        int: The total number of pages needed to display the categories.
+        tuple[list[CategoryData], int]: A sublist of categories for the specified page
+            and the total number of pages needed to display all categories.
     """
-    return (len(categories) + MAXIMUM_CATEGORIES_PER_PAGE - 1) // MAXIMUM_CATEGORIES_PER_PAGE
+    total_pages = _count_categories_pages(len(categories))
+    start_index = page * MAXIMUM_CATEGORIES_PER_PAGE
+    end_index = start_index + MAXIMUM_CATEGORIES_PER_PAGE
+    return categories[start_index:end_index], total_pages
 
 
-def _paginate_categories(categories: list[CategoryData], page: int) -> list[CategoryData]:
-    """Paginate a list of categories.
+def _count_categories_pages(categories_count: int) -> int:
+    """Count the pages needed to display the given number of categories.
 
     Args:
-        categories (list[CategoryData]): The list of categories to paginate.
-        page (int): The page number to retrieve.
+        categories_count (int): The number of categories.
 
     Returns:
-        list[CategoryData]: A sublist of categories for the specified page.
+        int: The total number of pages.
     """
-    start_index = page * MAXIMUM_CATEGORIES_PER_PAGE
-    end_index = start_index + MAXIMUM_CATEGORIES_PER_PAGE
-    return categories[start_index:end_index]
+    return (categories_count + MAXIMUM_CATEGORIES_PER_PAGE - 1) // MAXIMUM_CATEGORIES_PER_PAGE
 
 
+@lru_cache(maxsize=CATEGORIES_KEYBOARDS_CACHE_SIZE)
 def _get_categories_inline_keyboard_markup(
-    paginated_categories: list[CategoryData],
+    paginated_categories: tuple[CategoryData, ...],
     page: int,
     total_pages: int,
     navigation_callback_data: NavigationCallbackData,
 ) -> types.InlineKeyboardMarkup:
     """Generate an inline keyboard markup for categories with pagination.
 
+    The markup depends only on the arguments, so it is memoized: flipping back and forth between pages,
+    or several users with the same page of categories, reuse the already built markup. A change in the
+    user's categories changes the arguments, so stale markups are never returned.
+
     Args:
-        paginated_categories (list[CategoryData]): A list of category data for the current page.
+        paginated_categories (tuple[CategoryData, ...]): The category data for the current page.
         page (int): The current page number.
         total_pages (int): The total number of pages.
         navigation_callback_data (NavigationCallbackData): Callback data for navigation buttons.
@@ -185,39 +303,37 @@ def _get_categories_inline_keyboard_markup(
     Returns:
         types.InlineKeyboardMarkup: The inline keyboard markup with category buttons and navigation buttons.
     """
-    inline_keyboard: list[list[types.InlineKeyboardButton]] = _get_categories_inline_keyboard(paginated_categories)
-    inline_keyboard.append(get_navigation_inline_keyboard(page, total_pages, navigation_callback_data))
-    return types.InlineKeyboardMarkup(inline_keyboard=inline_keyboard)
+    return types.InlineKeyboardMarkup(
+        inline_keyboard=[
+            *_get_categories_inline_keyboard(paginated_categories),
+            get_navigation_inline_keyboard(page, total_pages, navigation_callback_data),
+        ],
+    )
 
 
-def _get_categories_inline_keyboard(paginated_categories: list[CategoryData]) -> list[list[types.InlineKeyboardButton]]:
+def _get_categories_inline_keyboard(
+    paginated_categories: tuple[CategoryData, ...],
+) -> list[list[types.InlineKeyboardButton]]:
     """Generate an inline keyboard for Telegram bot with categories as buttons.
 
     Args:
-        paginated_categories (list[CategoryData]): A list of tuples where each tuple contains
+        paginated_categories (tuple[CategoryData, ...]): Tuples where each tuple contains
             a category name and category ID.
 
     Returns:
         list[list[InlineKeyboardButton]]: A list of lists, where each inner list represents
             a row of inline keyboard buttons for the categories.
     """
-    inline_keyboard = []
-    categories_in_row = 0
-    buttons_row = []
-    for category_name, category_id in paginated_categories:
-        if categories_in_row == MAXIMUM_CATEGORIES_PER_ROW:
-            inline_keyboard.append(buttons_row)
-            buttons_row = []
-            categories_in_row = 0
-        button = types.InlineKeyboardButton(
-            text=category_name,
-            callback_data=SelectedCategory(category_id=category_id, category_name=category_name).pack(),
-        )
-        buttons_row.append(button)
-        categories_in_row += 1
-    if buttons_row:
-        inline_keyboard.append(buttons_row)
-    return inline_keyboard
+    return [
+        [
+            types.InlineKeyboardButton(
+                text=category_name,
+                callback_data=SelectedCategory(category_id=category_id).pack(),
+            )
+            for category_name, category_id in buttons_row
+        ]
+        for buttons_row in batched(paginated_categories, MAXIMUM_CATEGORIES_PER_ROW)
+    ]
 
 
 def get_navigation_inline_keyboard(
@@ -237,17 +353,54 @@ def get_navigation_inline_keyboard(
     """
     if total_pages == 1:
         return []
-    previous_page_button = types.InlineKeyboardButton(
-        text="<<",
-        callback_data=navigation_callback_data.prev_page,
-    )
     # it isn't complex F-string at all
     current_page_button = types.InlineKeyboardButton(
         text=f"{page + 1}/{total_pages}",  # noqa: WPS237
-        callback_data="current_page",
+        callback_data=CURRENT_PAGE_CALLBACK_DATA,
     )
-    next_page_button = types.InlineKeyboardButton(
-        text=">>",
-        callback_data=navigation_callback_data.next_page,
+    return [
+        _get_arrow_button("<<", navigation_callback_data.prev_page),
+        current_page_button,
+        _get_arrow_button(">>", navigation_callback_data.next_page),
+    ]
+
+
+@lru_cache(maxsize=NAVIGATION_KEYBOARDS_CACHE_SIZE)
+def get_navigation_inline_keyboard_markup(
+    page: int,
+    total_pages: int,
+    navigation_callback_data: NavigationCallbackData,
+) -> types.InlineKeyboardMarkup:
+    """Return an inline keyboard markup that consists only of the navigation row.
+
+    The markup depends only on its arguments, so it is built once for every page and total pages
+    pair and reused by the following page turns. The returned markup is shared and must not be mutated.
+
+    Args:
+        page (int): The current page number.
+        total_pages (int): The total number of pages.
+        navigation_callback_data (NavigationCallbackData): An object containing callback data for navigation buttons.
+
+    Returns:
+        types.InlineKeyboardMarkup: The inline keyboard markup with the navigation buttons.
+    """
+    return types.InlineKeyboardMarkup(
+        inline_keyboard=[get_navigation_inline_keyboard(page, total_pages, navigation_callback_data)],
     )
-    return [previous_page_button, current_page_button, next_page_button]
+
+
+@cache
+def _get_arrow_button(text: str, callback_data: str) -> types.InlineKeyboardButton:
+    """Return a shared navigation arrow button for the given text and callback data.
+
+    Arrow buttons never change for a given callback data, so a single instance is created
+    and reused by every navigation row instead of being validated again on each render.
+
+    Args:
+        text (str): The text of the arrow button.
+        callback_data (str): The callback data sent when the button is pressed.
+
+    Returns:
+        types.InlineKeyboardButton: The navigation arrow button.
+    """
+    return types.InlineKeyboardButton(text=text, callback_data=callback_data)
@@ -1,11 +1,52 @@
 """Module provides functions to generate various types of Telegram bot keyboards using the aiogram library."""
+from collections.abc import Callable
+from functools import wraps
+from typing import Final
+
 from aiogram import types
 from aiogram_i18n import I18nContext
 from aiogram_i18n.types import KeyboardButton, ReplyKeyboardMarkup
 
 from config import LANGUAGES
 
+_LANGUAGE_BUTTONS: Final = tuple((label, code) for code, label in LANGUAGES.items())
+
+_LANGUAGE_INLINE_KEYBOARD: Final = types.InlineKeyboardMarkup(
+    inline_keyboard=[
+        [types.InlineKeyboardButton(text=label, callback_data=code) for label, code in _LANGUAGE_BUTTONS],
+    ],
+)
+
+type KeyboardBuilder = Callable[[I18nContext], ReplyKeyboardMarkup]
+
+
+def _cache_per_locale(keyboard_builder: KeyboardBuilder) -> KeyboardBuilder:
+    """Memoize a keyboard builder per locale.
+
+    The reply keyboards depend only on the user's locale, so every keyboard is built once per
+    locale and the same markup object is returned to all users of that locale afterwards.
+    I18nContext itself is not hashable, so the cache is keyed on ``i18n.locale``.
+
+    Args:
+        keyboard_builder (KeyboardBuilder): The function building the keyboard for an i18n context.
+
+    Returns:
+        KeyboardBuilder: The memoized keyboard builder.
+    """
+    keyboards: dict[str, ReplyKeyboardMarkup] = {}
+
+    @wraps(keyboard_builder)
+    def cached_keyboard_builder(i18n: I18nContext) -> ReplyKeyboardMarkup:
+        keyboard = keyboards.get(i18n.locale)
+        if keyboard is None:
+            keyboard = keyboard_builder(i18n)
+            keyboards[i18n.locale] = keyboard
+        return keyboard
+
+    return cached_keyboard_builder
+
 
+@_cache_per_locale
 def get_settings_menu_keyboard(i18n: I18nContext) -> ReplyKeyboardMarkup:
     """Generate a settings menu keyboard for a Telegram bot.
 
@@ -26,6 +67,7 @@ def get_settings_menu_keyboard(i18n: I18nContext) -> ReplyKeyboardMarkup:
     return ReplyKeyboardMarkup(keyboard=settings_buttons, resize_keyboard=True)
 
 
+@_cache_per_locale
 def get_statistics_menu_keyboard(i18n: I18nContext) -> ReplyKeyboardMarkup:
     """Generate a statistics menu keyboard for a Telegram bot.
 
@@ -45,6 +87,7 @@ def get_statistics_menu_keyboard(i18n: I18nContext) -> ReplyKeyboardMarkup:
     return ReplyKeyboardMarkup(keyboard=statistics_buttons, resize_keyboard=True)
 
 
+@_cache_per_locale
 def get_category_settings_menu_keyboard(i18n: I18nContext) -> ReplyKeyboardMarkup:
     """Generate a category settings menu keyboard for a Telegram bot.
 
@@ -64,6 +107,7 @@ def get_category_settings_menu_keyboard(i18n: I18nContext) -> ReplyKeyboardMarku
     return ReplyKeyboardMarkup(keyboard=category_settings_buttons, resize_keyboard=True)
 
 
+@_cache_per_locale
 def get_menu_keyboard_error_tg_id(i18n: I18nContext) -> ReplyKeyboardMarkup:
     """Generate a ReplyKeyboardMarkup object with basic buttons for the menu keyboard.
 
@@ -77,6 +121,7 @@ def get_menu_keyboard_error_tg_id(i18n: I18nContext) -> ReplyKeyboardMarkup:
     return ReplyKeyboardMarkup(keyboard=basic_keyboard, resize_keyboard=True)
 
 
+@_cache_per_locale
 def get_menu_keyboard(i18n: I18nContext) -> ReplyKeyboardMarkup:
     """Generate a reply keyboard markup for the menu.
 
@@ -90,6 +135,7 @@ def get_menu_keyboard(i18n: I18nContext) -> ReplyKeyboardMarkup:
     return ReplyKeyboardMarkup(keyboard=basic_keyboard, resize_keyboard=True)
 
 
+@_cache_per_locale
 def get_post_menu_keyboard(i18n: I18nContext) -> ReplyKeyboardMarkup:
     """Generate a ReplyKeyboardMarkup object for the post menu.
 
@@ -104,6 +150,7 @@ def get_post_menu_keyboard(i18n: I18nContext) -> ReplyKeyboardMarkup:
     return ReplyKeyboardMarkup(keyboard=basic_keyboard, resize_keyboard=True)
 
 
+@_cache_per_locale
 def get_add_categories_keyboard(i18n: I18nContext) -> ReplyKeyboardMarkup:
     """Generate a ReplyKeyboardMarkup object for the entering category/ies selection.
 
@@ -118,28 +165,15 @@ def get_add_categories_keyboard(i18n: I18nContext) -> ReplyKeyboardMarkup:
 
 
 def get_language_inline_keyboard() -> types.InlineKeyboardMarkup:
-    """Create an inline keyboard markup for language selection.
+    """Return the inline keyboard markup for language selection.
 
-    The keyboard contains two buttons for selecting languages:
-    English ("en") and Russian ("ru").
+    The keyboard contains a button for every supported language and does not depend on the user's locale,
+    so it is built once at import time and shared between all calls.
 
     Returns:
         types.InlineKeyboardMarkup: An inline keyboard markup with language selection buttons.
     """
-    return types.InlineKeyboardMarkup(
-        inline_keyboard=[
-            [
-                types.InlineKeyboardButton(
-                    text=LANGUAGES["en"],
-                    callback_data="en",
-                ),
-                types.InlineKeyboardButton(
-                    text=LANGUAGES["ru"],
-                    callback_data="ru",
-                ),
-            ],
-        ],
-    )
+    return _LANGUAGE_INLINE_KEYBOARD
 
 
 def _get_basic_buttons(i18n: I18nContext) -> list[list[KeyboardButton]]:
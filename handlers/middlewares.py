@@ -0,0 +1,59 @@
+"""Module provides custom aiogram middlewares used by the bot routers."""
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from aiogram import BaseMiddleware
+from aiogram.types import Message, TelegramObject
+
+from handlers.error_utils import SafeExitProtocol, handle_error_situation
+
+
+class RequireFromUserMiddleware(BaseMiddleware):
+    """Middleware that rejects messages without sender information and injects the sender ID.
+
+    It replaces the ``if message.from_user is None`` check every handler of a router would
+    otherwise repeat. Messages without a sender are answered with the user info error once,
+    before the handler is called, and the handlers receive the sender ID as ``user_id``.
+
+    Attributes:
+        ensure_safe_exit (SafeExitProtocol): The safe exit procedure of the router the middleware is attached to.
+    """
+
+    def __init__(self, ensure_safe_exit: SafeExitProtocol) -> None:
+        """Initialize the middleware with the safe exit procedure of the router.
+
+        Args:
+            ensure_safe_exit (SafeExitProtocol): The safe exit procedure to run when the sender is unknown.
+        """
+        self.ensure_safe_exit = ensure_safe_exit
+
+    async def __call__(
+        self,
+        # the parameter names are fixed by aiogram's BaseMiddleware.__call__
+        handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],  # noqa: WPS110
+        event: TelegramObject,
+        data: dict[str, Any],  # noqa: WPS110
+    ) -> Any:  # noqa: ANN401
+        """Call the handler only if the message has sender information.
+
+        Args:
+            handler (Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]]): The wrapped handler.
+            event (TelegramObject): The incoming message.
+            data (dict[str, Any]): The handler keyword arguments.
+
+        Returns:
+            Any: The result of the handler, or None if the message has no sender information.
+        """
+        if not isinstance(event, Message):
+            return await handler(event, data)
+        if event.from_user is None:
+            await handle_error_situation(
+                message=event,
+                state=data["state"],
+                i18n=data["i18n"],
+                answer_key="ERROR_USER_INFO",
+                ensure_safe_exit=self.ensure_safe_exit,
+            )
+            return None
+        data["user_id"] = event.from_user.id
+        return await handler(event, data)
@@ -1,14 +1,16 @@
 """Module contains the registration handler for new users."""
 from aiogram import F, Router, types  # noqa: WPS347
 from aiogram.fsm.context import FSMContext
-from aiogram_i18n import I18nContext, LazyProxy
+from aiogram_i18n import I18nContext
 
 from config import LANGUAGES
 from handlers.basic.states import start_menu
 from handlers.error_utils import handle_error_situation
+from handlers.filters import CATEGORY_END_BUTTON_FILTER
 from handlers.handlers_utils import add_category_handler
 from handlers.keyboards import get_add_categories_keyboard, get_language_inline_keyboard, get_menu_keyboard
 from handlers.registration.states import RegistrationStates
+from handlers.state_utils import get_state_fields, set_state_and_update_data
 from services.users_service import UserNotRegisteredError, add_user
 
 registration_router: Router = Router()
@@ -23,7 +25,7 @@ async def start_registration(message: types.Message, state: FSMContext, i18n: I1
         i18n (I18nContext): The internationalization context for retrieving localized messages.
     """
     if message.from_user is None:
-        await handle_error_situation(message, state, i18n, i18n.get("ERROR_USER_INFO"), _ensure_safe_exit)
+        await handle_error_situation(message, state, i18n, "ERROR_USER_INFO", _ensure_safe_exit)
         return
 
     await state.set_state(RegistrationStates.waiting_for_language)
@@ -67,12 +69,12 @@ async def currency_handler(message: types.Message, state: FSMContext, i18n: I18n
         i18n (I18nContext): The internationalization context to handle multilingual support.
     """
     if message.from_user is None:
-        await handle_error_situation(message, state, i18n, i18n.get("ERROR_USER_INFO"), _ensure_safe_exit)
+        await handle_error_situation(message, state, i18n, "ERROR_USER_INFO", _ensure_safe_exit)
         return
 
     currency = message.text
     if not currency:
-        await handle_error_situation(message, state, i18n, i18n.get("ERROR_CURRENCY"), _ensure_safe_exit)
+        await handle_error_situation(message, state, i18n, "ERROR_CURRENCY", _ensure_safe_exit)
         return
 
     await state.update_data(currency=currency)
@@ -85,7 +87,7 @@ async def currency_handler(message: types.Message, state: FSMContext, i18n: I18n
 
 @registration_router.message(
     RegistrationStates.waiting_for_categories,
-    F.text != LazyProxy("CATEGORY_END_BUTTON"),
+    ~CATEGORY_END_BUTTON_FILTER,
 )
 async def categories_handler(message: types.Message, state: FSMContext, i18n: I18nContext) -> None:
     """Handle the categories command from the user.
@@ -100,14 +102,14 @@ async def categories_handler(message: types.Message, state: FSMContext, i18n: I1
         i18n (I18nContext): The internationalization context for handling translations.
     """
     if message.from_user is None:
-        await handle_error_situation(message, state, i18n, i18n.get("ERROR_USER_INFO"), _ensure_safe_exit)
+        await handle_error_situation(message, state, i18n, "ERROR_USER_INFO", _ensure_safe_exit)
         return
     await add_category_handler(message, state, i18n, _ensure_safe_exit)
 
 
 @registration_router.message(
     RegistrationStates.waiting_for_categories,
-    F.text == LazyProxy("CATEGORY_END_BUTTON"),
+    CATEGORY_END_BUTTON_FILTER,
 )
 async def end_registration_handler(message: types.Message, state: FSMContext, i18n: I18nContext) -> None:
     """Handle the end of the registration process.
@@ -115,13 +117,11 @@ async def end_registration_handler(message: types.Message, state: FSMContext, i1
     This asynchronous function handles the end of the registration process by performing the following steps:
 
     1. Retrieves the user information from the message.
-    2. Retrieves the current state data.
-    3. If the user information is not present, it handles the error.
-    4. If the state data is not present, it handles the error.
-    5. Retrieves the user's language and currency from the state data.
-    6. Retrieves the list of categories from the state data.
-    7. Sends a message to the user with the registration details.
-    8. Resets the state to the start menu.
+    2. If the user information is not present, it handles the error.
+    3. Retrieves the user's language, currency and categories from the state data with a single read.
+    4. If any of them is not present, it handles the error.
+    5. Sends a message to the user with the registration details.
+    6. Resets the state to the start menu.
 
     Args:
         message (types.Message): The message object from the user.
@@ -129,20 +129,12 @@ async def end_registration_handler(message: types.Message, state: FSMContext, i1
         i18n (I18nContext): The internationalization context for handling translations.
     """
     if message.from_user is None:
-        await handle_error_situation(message, state, i18n, i18n.get("ERROR_USER_INFO"), _ensure_safe_exit)
+        await handle_error_situation(message, state, i18n, "ERROR_USER_INFO", _ensure_safe_exit)
         return
 
-    state_data = await state.get_data()
-    if not state_data:
-        await handle_error_situation(message, state, i18n, i18n.get("ERROR_REGISTRATION"), _ensure_safe_exit)
-        return
-
-    language = state_data.get("locale")
-    currency = state_data.get("currency")
-    categories = state_data.get("categories")
-
+    language, currency, categories = await get_state_fields(state, "locale", "currency", "categories")
     if not language or not currency or not categories:
-        await handle_error_situation(message, state, i18n, i18n.get("ERROR_REGISTRATION"), _ensure_safe_exit)
+        await handle_error_situation(message, state, i18n, "ERROR_REGISTRATION", _ensure_safe_exit)
         return
     try:
         await add_user(
@@ -152,7 +144,7 @@ async def end_registration_handler(message: types.Message, state: FSMContext, i1
             categories,
         )
     except UserNotRegisteredError:
-        await handle_error_situation(message, state, i18n, i18n.get("ERROR_REGISTRATION"), _ensure_safe_exit)
+        await handle_error_situation(message, state, i18n, "ERROR_REGISTRATION", _ensure_safe_exit)
         return
 
     registration_details = i18n.get(
@@ -171,8 +163,9 @@ async def _ensure_safe_exit(state: FSMContext) -> None:
     Args:
         state (FSMContext): The finite state machine context to be reset.
     """
-    await state.set_state(start_menu)
-    await state.update_data(
+    await set_state_and_update_data(
+        state,
+        start_menu,
         currency=None,
         categories=[],
     )
@@ -1,11 +1,13 @@
 """Handler for adding new categories to the user's expenses categories list."""
-from aiogram import F, Router, types  # noqa: WPS347
+from aiogram import Router, types  # noqa: WPS347
 from aiogram.fsm.context import FSMContext
-from aiogram_i18n import I18nContext, LazyProxy
+from aiogram_i18n import I18nContext
 
 from handlers.error_utils import handle_error_situation
+from handlers.filters import CATEGORY_END_BUTTON_FILTER, LocalizedTextFilter
 from handlers.handlers_utils import add_category_handler
 from handlers.keyboards import get_add_categories_keyboard, get_menu_keyboard
+from handlers.middlewares import RequireFromUserMiddleware
 from handlers.settings_menu.categories_settings_menu.add_categories.states import waiting_categories
 from handlers.settings_menu.categories_settings_menu.states import categories_settings_menu
 from handlers.settings_menu.states import settings_menu
@@ -13,8 +15,10 @@ from services.user_configs_service import UserConfigNotChangedError, add_user_ex
 
 add_category_router: Router = Router()
 
+ADD_CATEGORY_BUTTON_FILTER = LocalizedTextFilter("ADD_CATEGORY_BUTTON")
 
-@add_category_router.message(categories_settings_menu, F.text == LazyProxy("ADD_CATEGORY_BUTTON"))
+
+@add_category_router.message(categories_settings_menu, ADD_CATEGORY_BUTTON_FILTER)
 async def add_categories_handler(message: types.Message, state: FSMContext, i18n: I18nContext) -> None:
     """Handle the addition of new categories by the user.
 
@@ -23,16 +27,6 @@ async def add_categories_handler(message: types.Message, state: FSMContext, i18n
         state (FSMContext): The finite state machine context to manage the state of the conversation.
         i18n (I18nContext): The internationalization context for handling localized messages.
     """
-    if message.from_user is None:
-        await handle_error_situation(
-            message=message,
-            state=state,
-            i18n=i18n,
-            answer_text=i18n.get("ERROR_USER_INFO"),
-            ensure_safe_exit=_ensure_safe_exit,
-        )
-        return
-
     await state.set_state(waiting_categories)
     await message.answer(
         i18n.get("INPUT_CATEGORIES_MESSAGE"),
@@ -42,64 +36,56 @@ async def add_categories_handler(message: types.Message, state: FSMContext, i18n
 
 @add_category_router.message(
     waiting_categories,
-    F.text != LazyProxy("CATEGORY_END_BUTTON"),
+    ~CATEGORY_END_BUTTON_FILTER,
 )
 async def add_new_category_handler(message: types.Message, state: FSMContext, i18n: I18nContext) -> None:
     """Handle the addition of a new category.
 
     This asynchronous function processes a message to add a new category.
-    It first checks if the message's sender information is available.
-    If not, it handles the error situation.
-    If the sender information is available, it proceeds to add the category.
+    The sender information is already checked by the router middleware.
 
     Args:
         message (types.Message): The message object containing the category information.
         state (FSMContext): The finite state machine context for the current user.
         i18n (I18nContext): The internationalization context for handling translations.
     """
-    if message.from_user is None:
-        await handle_error_situation(message, state, i18n, i18n.get("ERROR_USER_INFO"), _ensure_safe_exit)
-        return
     await add_category_handler(message, state, i18n, _ensure_safe_exit)
 
 
-@add_category_router.message(waiting_categories, F.text == LazyProxy("CATEGORY_END_BUTTON"))
-async def end_categories_input_handler(message: types.Message, state: FSMContext, i18n: I18nContext) -> None:
+@add_category_router.message(waiting_categories, CATEGORY_END_BUTTON_FILTER)
+async def end_categories_input_handler(
+    message: types.Message,
+    state: FSMContext,
+    i18n: I18nContext,
+    user_id: int,
+) -> None:
     """Handle the end of the categories input process.
 
     Args:
         message (types.Message): The message object containing the user's input.
         state (FSMContext): The finite state machine context for the current user.
         i18n (I18nContext): The internationalization context for retrieving localized strings.
+        user_id (int): The Telegram ID of the user, injected by RequireFromUserMiddleware.
     """
     state_data = await state.get_data()
     categories = state_data.get("categories", [])
-    if not message.from_user:
-        await handle_error_situation(
-            message=message,
-            state=state,
-            i18n=i18n,
-            answer_text=i18n.get("ERROR_USER_INFO"),
-            ensure_safe_exit=_ensure_safe_exit,
-        )
-        return
     if not categories:
         await handle_error_situation(
             message=message,
             state=state,
             i18n=i18n,
-            answer_text=i18n.get("ERROR_CATEGORIES"),
+            answer_key="ERROR_CATEGORIES",
             ensure_safe_exit=_ensure_safe_exit,
         )
         return
     try:
-        await add_user_expenses_categories(message.from_user.id, categories)
+        await add_user_expenses_categories(user_id, categories)
     except UserConfigNotChangedError:
         await handle_error_situation(
             message=message,
             state=state,
             i18n=i18n,
-            answer_text=i18n.get("ERROR_CATEGORY_NOT_ADDED"),
+            answer_key="ERROR_CATEGORY_NOT_ADDED",
             ensure_safe_exit=_ensure_safe_exit,
         )
         return
@@ -120,3 +106,6 @@ async def _ensure_safe_exit(state: FSMContext) -> None:
         categories=[],
     )
     await state.set_state(settings_menu)
+
+
+add_category_router.message.middleware(RequireFromUserMiddleware(_ensure_safe_exit))
@@ -1,18 +1,21 @@
 """Handler for the category settings menu interaction."""
-from aiogram import F, Router  # noqa: WPS347
+from aiogram import Router
 from aiogram.fsm.context import FSMContext
 from aiogram.types import Message
-from aiogram_i18n import I18nContext, LazyProxy
+from aiogram_i18n import I18nContext
 
-from handlers.error_utils import handle_error_situation
+from handlers.filters import LocalizedTextFilter
 from handlers.keyboards import get_category_settings_menu_keyboard
+from handlers.middlewares import RequireFromUserMiddleware
 from handlers.settings_menu.categories_settings_menu.states import categories_settings_menu
 from handlers.settings_menu.states import settings_menu
 
 category_settings_menu_router: Router = Router()
 
+CATEGORIES_SETTINGS_MENU_BUTTON_FILTER = LocalizedTextFilter("CATEGORIES_SETTINGS_MENU_BUTTON")
 
-@category_settings_menu_router.message(settings_menu, F.text == LazyProxy("CATEGORIES_SETTINGS_MENU_BUTTON"))
+
+@category_settings_menu_router.message(settings_menu, CATEGORIES_SETTINGS_MENU_BUTTON_FILTER)
 async def category_settings_menu_handler(message: Message, state: FSMContext, i18n: I18nContext) -> None:
     """Handle the category settings menu interaction.
 
@@ -25,16 +28,6 @@ async def category_settings_menu_handler(message: Message, state: FSMContext, i1
         state (FSMContext): The finite state machine context for managing user states.
         i18n (I18nContext): The internationalization context for handling translations.
     """
-    if message.from_user is None:
-        await handle_error_situation(
-            message=message,
-            state=state,
-            i18n=i18n,
-            answer_text=i18n.get("ERROR_USER_INFO"),
-            ensure_safe_exit=_ensure_safe_exit,
-        )
-        return
-
     await message.answer(
         text=i18n.get("CHOOSE_CATEGORY_SETTINGS_MENU_ITEM"),
         reply_markup=get_category_settings_menu_keyboard(i18n),
@@ -49,3 +42,6 @@ async def _ensure_safe_exit(state: FSMContext) -> None:
         state (FSMContext): The finite state machine context to be reset.
     """
     await state.set_state(settings_menu)
+
+
+category_settings_menu_router.message.middleware(RequireFromUserMiddleware(_ensure_safe_exit))
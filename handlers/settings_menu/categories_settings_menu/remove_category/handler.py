@@ -1,75 +1,94 @@
 """Module provides handlers for managing the removal of user-defined expense categories."""
+import asyncio
+
 from aiogram import F, Router, types  # noqa: WPS347
 from aiogram.fsm.context import FSMContext
-from aiogram_i18n import I18nContext, LazyProxy
+from aiogram_i18n import I18nContext
 
 from handlers.error_utils import handle_error_situation
+from handlers.filters import LocalizedTextFilter
 from handlers.handlers_utils import (
+    CONFIRMATION_CALLBACK_DATA,
+    CURRENT_PAGE_CALLBACK_DATA,
     NavigationCallbackData,
     SelectedCategory,
     get_categories_inline_keyboard_and_total_pages,
+    get_categories_total_pages,
+    get_category_name,
     get_confirmation_inline_keyboard_markup,
 )
 from handlers.keyboards import get_menu_keyboard
+from handlers.middlewares import RequireFromUserMiddleware
 from handlers.settings_menu.categories_settings_menu.remove_category.states import RemoveCategoryStatesGroup
 from handlers.settings_menu.categories_settings_menu.states import categories_settings_menu
 from handlers.settings_menu.states import settings_menu
+from handlers.state_utils import set_state_and_update_data
 from services.user_configs_service import UserConfigNotChangedError, remove_user_expenses_category
 
 REMOVE_CATEGORY_PAGES_CALLBACK_DATA = NavigationCallbackData(
     next_page="next_page_remove_category",
     prev_page="prev_page_remove_category",
 )
+# callback data of the buttons under the categories list that are not categories themselves
+REMOVE_CATEGORY_SERVICE_CALLBACK_DATA = frozenset((
+    REMOVE_CATEGORY_PAGES_CALLBACK_DATA.next_page,
+    REMOVE_CATEGORY_PAGES_CALLBACK_DATA.prev_page,
+    CURRENT_PAGE_CALLBACK_DATA,
+))
+
+# How many users' current pages are remembered, the oldest one is forgotten first.
+CURRENT_PAGES_CACHE_SIZE = 1024
+
+# Maps user_id to the current page of the categories list shown to the user.
+# The page is UI bookkeeping only, so it is kept in memory instead of the FSM storage.
+_current_pages: dict[int, int] = {}
+# IDs of the users whose category removal confirmation is being processed right now.
+_confirmations_in_progress: set[int] = set()
 
 remove_category_router: Router = Router()
 
+REMOVE_CATEGORY_BUTTON_FILTER = LocalizedTextFilter("REMOVE_CATEGORY_BUTTON")
+
 
-@remove_category_router.message(categories_settings_menu, F.text == LazyProxy("REMOVE_CATEGORY_BUTTON"))
-async def remove_category_handler(message: types.Message, state: FSMContext, i18n: I18nContext) -> None:
+@remove_category_router.message(categories_settings_menu, REMOVE_CATEGORY_BUTTON_FILTER)
+async def remove_category_handler(
+    message: types.Message,
+    state: FSMContext,
+    i18n: I18nContext,
+    user_id: int,
+) -> None:
     """Handle the removal of a category by guiding the user through the process.
 
     This asynchronous handler function is triggered when a user initiates the process
-    of removing a category. It validates the user's information, updates the state
-    with the provided category name, and displays an inline keyboard for category
-    selection. If no categories are available, it handles the error situation
-    gracefully.
+    of removing a category. It updates the state with the provided category name,
+    and displays an inline keyboard for category selection. If no categories are
+    available, it handles the error situation gracefully.
 
     Args:
         message (types.Message): The incoming message object from the user.
         state (FSMContext): The finite state machine context for managing user states.
         i18n (I18nContext): The internationalization context for retrieving localized strings.
+        user_id (int): The Telegram ID of the user, injected by RequireFromUserMiddleware.
     """
-    if message.from_user is None:
-        await handle_error_situation(
-            message=message,
-            state=state,
-            i18n=i18n,
-            answer_text=i18n.get("ERROR_USER_INFO"),
-            ensure_safe_exit=_ensure_safe_exit,
-        )
-        return
-
-    await state.update_data(name=message.text)
-    await state.set_state(RemoveCategoryStatesGroup.selecting_category)
-    inline_keyboard_markup, total_pages = await get_categories_inline_keyboard_and_total_pages(
-        message.from_user.id,
-        page=0,
-        navigation_callback_data=REMOVE_CATEGORY_PAGES_CALLBACK_DATA,
+    (inline_keyboard_markup, total_pages), _ = await asyncio.gather(  # noqa: WPS414
+        get_categories_inline_keyboard_and_total_pages(
+            user_id,
+            page=0,
+            navigation_callback_data=REMOVE_CATEGORY_PAGES_CALLBACK_DATA,
+        ),
+        state.set_state(RemoveCategoryStatesGroup.selecting_category),
     )
     if not inline_keyboard_markup or not total_pages:
         await handle_error_situation(
             message=message,
             state=state,
             i18n=i18n,
-            answer_text=i18n.get("ERROR_NO_CATEGORIES"),
+            answer_key="ERROR_NO_CATEGORIES",
             ensure_safe_exit=_ensure_safe_exit,
         )
         return
-    # its already checked upper. Not 1 or Not None = True
-    await state.update_data(
-        current_page_remove_category=0,
-        last_page_remove_category=total_pages - 1,
-    )  # pyright: ignore[reportOptionalOperand]
+    await state.update_data(name=message.text)
+    _store_current_page(user_id, 0)
     await message.answer(
         i18n.get("CHOOSE_CATEGORY_TO_REMOVE"),
         reply_markup=inline_keyboard_markup,
@@ -80,67 +99,60 @@ async def remove_category_handler(message: types.Message, state: FSMContext, i18
     F.data == "next_page_remove_category",
     RemoveCategoryStatesGroup.selecting_category,
 )
-async def next_page_remove_category_button_handler(callback_query: types.CallbackQuery, state: FSMContext) -> None:
+async def next_page_remove_category_button_handler(callback_query: types.CallbackQuery) -> None:
     """Handle the "next page" button press in the remove category settings menu.
 
     This function is triggered when the user interacts with the "next page" button
     while navigating through the list of categories in the remove category settings menu.
-    It updates the current page in the state and calls a helper function to handle
-    the updated categories list.
+    It moves to the next page, looping back to the first one after the last page,
+    and calls a helper function to handle the updated categories list.
 
     Args:
         callback_query (types.CallbackQuery): The callback query object containing
             information about the user's interaction with the button.
-        state (FSMContext): The finite state machine context for storing and retrieving
-            user-specific data.
     """
     if not isinstance(callback_query.message, types.Message):
         return
     # it takes user_id from callback query, not message, because user_id from message is nonsense
     user_id = callback_query.from_user.id
-    state_data = await state.get_data()
-    current_page = state_data.get("current_page_remove_category", 0)
-    last_page = state_data.get("last_page_remove_category", 0)
-    if current_page == last_page:
-        await state.update_data(current_page_remove_category=0)
-    else:
-        await state.update_data(current_page_remove_category=current_page + 1)
-
-    await _handle_categories_list(user_id, callback_query.message, state)
+    total_pages = await get_categories_total_pages(user_id)
+    if total_pages <= 1:
+        return
+    current_page = min(_current_pages.get(user_id, 0), total_pages - 1)
+    new_page = 0 if current_page == total_pages - 1 else current_page + 1
+    await _handle_categories_list(user_id, callback_query.message, new_page)
 
 
 @remove_category_router.callback_query(
     F.data == "prev_page_remove_category",
     RemoveCategoryStatesGroup.selecting_category,
 )
-async def prev_page_remove_category_button_handler(callback_query: types.CallbackQuery, state: FSMContext) -> None:
+async def prev_page_remove_category_button_handler(callback_query: types.CallbackQuery) -> None:
     """Handle the "previous page" button press in the remove category menu.
 
-    This function updates the current page in the state to the previous page
-    or loops back to the last page if the current page is the first one. It
-    then updates the categories list display for the user.
+    This function moves to the previous page or loops back to the last page
+    if the current page is the first one. It then updates the categories list
+    display for the user.
 
     Args:
         callback_query (types.CallbackQuery): The callback query triggered by the user interaction.
-        state (FSMContext): The finite state machine context for storing user-specific data.
     """
     if not isinstance(callback_query.message, types.Message):
         return
     # it takes user_id from callback query, not message, because user_id from message is nonsense
     user_id = callback_query.from_user.id
-    state_data = await state.get_data()
-    current_page = state_data.get("current_page_remove_category", 0)
-    last_page = state_data.get("last_page_remove_category", 0)
-
-    if current_page == 0:
-        await state.update_data(current_page_remove_category=last_page)
-    else:
-        await state.update_data(current_page_remove_category=current_page - 1)
-
-    await _handle_categories_list(user_id, callback_query.message, state)
+    total_pages = await get_categories_total_pages(user_id)
+    if total_pages <= 1:
+        return
+    current_page = min(_current_pages.get(user_id, 0), total_pages - 1)
+    new_page = total_pages - 1 if current_page == 0 else current_page - 1
+    await _handle_categories_list(user_id, callback_query.message, new_page)
 
 
-@remove_category_router.callback_query(RemoveCategoryStatesGroup.selecting_category, F.data.not_contains("page"))
+@remove_category_router.callback_query(
+    RemoveCategoryStatesGroup.selecting_category,
+    F.data.not_in(REMOVE_CATEGORY_SERVICE_CALLBACK_DATA),
+)
 async def handle_category(callback_query: types.CallbackQuery, state: FSMContext, i18n: I18nContext) -> None:
     """Handle the callback query for removing a category in the settings menu.
 
@@ -162,19 +174,28 @@ async def handle_category(callback_query: types.CallbackQuery, state: FSMContext
             message=callback_query.message,
             state=state,
             i18n=i18n,
-            answer_text=i18n.get("ERROR_USER_INFO"),
+            answer_key="ERROR_USER_INFO",
             ensure_safe_exit=_ensure_safe_exit,
         )
         return
-    callback_data = SelectedCategory.unpack(callback_query.data)
-    category_id = callback_data.category_id
-    category_name = callback_data.category_name
+    try:
+        category_id = SelectedCategory.unpack_category_id(callback_query.data)
+    except ValueError:
+        await handle_error_situation(
+            message=callback_query.message,
+            state=state,
+            i18n=i18n,
+            answer_key="ERROR_UNKNOWN",
+            ensure_safe_exit=_ensure_safe_exit,
+        )
+        return
+    category_name = await get_category_name(callback_query.from_user.id, category_id)
     if not (category_name and category_id):
         await handle_error_situation(
             message=callback_query.message,
             state=state,
             i18n=i18n,
-            answer_text=i18n.get("ERROR_UNKNOWN"),
+            answer_key="ERROR_UNKNOWN",
             ensure_safe_exit=_ensure_safe_exit,
         )
         return
@@ -190,8 +211,10 @@ async def handle_category(callback_query: types.CallbackQuery, state: FSMContext
     )
 
 
-@remove_category_router.callback_query(RemoveCategoryStatesGroup.confirming_removal, F.data == "confirm")
-@remove_category_router.callback_query(RemoveCategoryStatesGroup.confirming_removal, F.data == "cancel")
+@remove_category_router.callback_query(
+    RemoveCategoryStatesGroup.confirming_removal,
+    F.data.in_(CONFIRMATION_CALLBACK_DATA),
+)
 async def handle_confirmation(callback_query: types.CallbackQuery, state: FSMContext, i18n: I18nContext) -> None:
     """Handle the confirmation callback query in the settings menu for removing a category.
 
@@ -214,7 +237,7 @@ async def handle_confirmation(callback_query: types.CallbackQuery, state: FSMCon
             message=callback_query.message,
             state=state,
             i18n=i18n,
-            answer_text=i18n.get("ERROR_USER_INFO"),
+            answer_key="ERROR_USER_INFO",
             ensure_safe_exit=_ensure_safe_exit,
         )
         return
@@ -224,30 +247,43 @@ async def handle_confirmation(callback_query: types.CallbackQuery, state: FSMCon
     await _handle_confirm(callback_query, state, i18n)
 
 
-async def _handle_categories_list(user_id: int, message: types.Message, state: FSMContext) -> None:
+async def _handle_categories_list(user_id: int, message: types.Message, current_page: int) -> None:
     """Handle the display of a paginated list of categories for a user to remove.
 
     Args:
         user_id (int): The ID of the user requesting the category list.
         message (types.Message): The message object containing the user's interaction.
-        state (FSMContext): The finite state machine context for managing user state.
+        current_page (int): The page of the categories list to display.
     """
     if not message.from_user:
         return
-    state_data = await state.get_data()
-    current_page = state_data.get("current_page_remove_category") or 0
-    inline_keyboard_markup, _ = await get_categories_inline_keyboard_and_total_pages(  # noqa: VNE003
+    inline_keyboard_markup, total_pages = await get_categories_inline_keyboard_and_total_pages(
         user_id,
         page=current_page,
         navigation_callback_data=REMOVE_CATEGORY_PAGES_CALLBACK_DATA,
     )
-    if not inline_keyboard_markup:
+    if not inline_keyboard_markup or not total_pages:
         return
+    _store_current_page(user_id, current_page)
     await message.edit_reply_markup(
         reply_markup=inline_keyboard_markup,
     )
 
 
+def _store_current_page(user_id: int, page: int) -> None:
+    """Remember the page of the categories list shown to the user, forgetting the oldest user if needed.
+
+    Args:
+        user_id (int): The ID of the user the page is shown to.
+        page (int): The page of the categories list shown to the user.
+    """
+    # the entry is moved to the end, so the first entry is always the least recently turned one
+    _current_pages.pop(user_id, None)
+    _current_pages[user_id] = page
+    if len(_current_pages) > CURRENT_PAGES_CACHE_SIZE:
+        del _current_pages[next(iter(_current_pages))]  # noqa: WPS420
+
+
 async def _handle_cancel(callback_query: types.CallbackQuery, state: FSMContext, i18n: I18nContext) -> None:
     """Handle the cancellation of the "remove category" operation in the settings menu.
 
@@ -268,40 +304,66 @@ async def _handle_cancel(callback_query: types.CallbackQuery, state: FSMContext,
 async def _handle_confirm(callback_query: types.CallbackQuery, state: FSMContext, i18n: I18nContext) -> None:
     """Handle the confirmation of removing a user-defined expense category.
 
+    Repeated confirmations from a user whose previous confirmation is still being processed
+    are ignored, so a double tap does not try to remove the same category twice.
+
     Args:
         callback_query (types.CallbackQuery):
             The callback query object containing information about the user's interaction.
         state (FSMContext): The finite state machine context for managing user states.
         i18n (I18nContext): The internationalization context for retrieving localized strings.
     """
-    if not callback_query.message or not isinstance(callback_query.message, types.Message):
+    if not isinstance(callback_query.message, types.Message):
         return
-    state_data = await state.get_data()
     user_tg_id = callback_query.from_user.id
+    if user_tg_id in _confirmations_in_progress:
+        return
+    _confirmations_in_progress.add(user_tg_id)
+    # nothing is caught here, the guard only has to be released however the removal ends
+    try:  # noqa: WPS501
+        await _remove_selected_category(user_tg_id, callback_query.message, state, i18n)
+    finally:
+        _confirmations_in_progress.discard(user_tg_id)
+
+
+async def _remove_selected_category(
+    user_tg_id: int,
+    message: types.Message,
+    state: FSMContext,
+    i18n: I18nContext,
+) -> None:
+    """Remove the category stored in the state and report the result to the user.
+
+    Args:
+        user_tg_id (int): The Telegram ID of the user removing the category.
+        message (types.Message): The message to answer to.
+        state (FSMContext): The finite state machine context for managing user states.
+        i18n (I18nContext): The internationalization context for retrieving localized strings.
+    """
+    state_data = await state.get_data()
     category_id = state_data.get("category_id")
-    if not all([user_tg_id, category_id]):
+    if not user_tg_id or not category_id:
         await handle_error_situation(
-            message=callback_query.message,
+            message=message,
             state=state,
             i18n=i18n,
-            answer_text=i18n.get("ERROR_UNKNOWN"),
+            answer_key="ERROR_UNKNOWN",
             ensure_safe_exit=_ensure_safe_exit,
         )
         return
     await _ensure_safe_exit(state)
     try:
-        # pyright do not understand not all() operation
-        await remove_user_expenses_category(user_tg_id, category_id)  # pyright: ignore[reportArgumentType]
+        await remove_user_expenses_category(user_tg_id, category_id)
     except UserConfigNotChangedError:
         await handle_error_situation(
-            message=callback_query.message,
+            message=message,
             state=state,
             i18n=i18n,
-            answer_text=i18n.get("ERROR_UNKNOWN"),
+            answer_key="ERROR_UNKNOWN",
             ensure_safe_exit=_ensure_safe_exit,
         )
         return
-    await callback_query.message.answer(i18n.get("CATEGORY_REMOVED"), reply_markup=get_menu_keyboard(i18n))
+    await message.answer(i18n.get("CATEGORY_REMOVED"), reply_markup=get_menu_keyboard(i18n))
 
 
 async def _ensure_safe_exit(state: FSMContext) -> None:
@@ -310,10 +372,13 @@ async def _ensure_safe_exit(state: FSMContext) -> None:
     Args:
         state (FSMContext): The finite state machine context to be reset.
     """
-    await state.update_data(
+    await set_state_and_update_data(
+        state,
+        settings_menu,
         name=None,
         category_id=None,
-        current_page_remove_category=0,
-        last_page_remove_category=0,
     )
-    await state.set_state(settings_menu)
+    _current_pages.pop(state.key.user_id, None)
+
+
+remove_category_router.message.middleware(RequireFromUserMiddleware(_ensure_safe_exit))
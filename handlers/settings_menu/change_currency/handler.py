@@ -1,20 +1,30 @@
 """Handlers for changing the currency in the settings menu."""
+from types import MappingProxyType
+
 from aiogram import F, Router, types  # noqa: WPS347
 from aiogram.fsm.context import FSMContext
-from aiogram_i18n import I18nContext, LazyProxy
+from aiogram_i18n import I18nContext
 
 from handlers.error_utils import handle_error_situation
-from handlers.handlers_utils import get_confirmation_inline_keyboard_markup
+from handlers.filters import LocalizedTextFilter
+from handlers.handlers_utils import (
+    CONFIRMATION_CALLBACK_DATA,
+    get_confirmation_inline_keyboard_markup,
+    get_static_text,
+)
 from handlers.keyboards import get_post_menu_keyboard, get_settings_menu_keyboard
-from handlers.settings_menu.change_currency.states import ChangeCurrencyStatesGroup
+from handlers.settings_menu.change_currency.states import confirming_currency_change, waiting_for_currency
 from handlers.settings_menu.states import settings_menu
+from handlers.state_utils import set_state_and_update_data
 from services.expenses_service import get_all_currencies_used_by_tg_id
 from services.user_configs_service import UserConfigNotChangedError, set_currency_by_tg_id
 
 change_currency_router: Router = Router()
 
+CHANGE_CURRENCY_MENU_BUTTON_FILTER = LocalizedTextFilter("CHANGE_CURRENCY_MENU_BUTTON")
+
 
-@change_currency_router.message(settings_menu, F.text == LazyProxy("CHANGE_CURRENCY_MENU_BUTTON"))
+@change_currency_router.message(settings_menu, CHANGE_CURRENCY_MENU_BUTTON_FILTER)
 async def change_currency_handler(message: types.Message, state: FSMContext, i18n: I18nContext) -> None:
     """Handle the process of changing the currency in the settings menu.
 
@@ -32,13 +42,13 @@ async def change_currency_handler(message: types.Message, state: FSMContext, i18
             message=message,
             state=state,
             i18n=i18n,
-            answer_text=i18n.get("ERROR_USER_INFO"),
+            answer_key="ERROR_USER_INFO",
             ensure_safe_exit=_ensure_safe_exit,
         )
         return
-    await state.set_state(ChangeCurrencyStatesGroup.waiting_for_currency)
+    await state.set_state(waiting_for_currency)
     currencies = await get_all_currencies_used_by_tg_id(message.from_user.id)
-    currencies_text = "\n".join(currencies) if currencies else i18n.get("ERROR_NO_CURRENCIES")
+    currencies_text = "\n".join(currencies) if currencies else get_static_text("ERROR_NO_CURRENCIES", i18n.locale)
 
     await message.answer(
         text=i18n.get("INPUT_CURRENCY_MESSAGE", currencies=currencies_text),
@@ -46,7 +56,7 @@ async def change_currency_handler(message: types.Message, state: FSMContext, i18
     )
 
 
-@change_currency_router.message(ChangeCurrencyStatesGroup.waiting_for_currency)
+@change_currency_router.message(waiting_for_currency)
 async def set_currency_handler(message: types.Message, state: FSMContext, i18n: I18nContext) -> None:
     """Handle the process of setting a new currency for the user.
 
@@ -64,18 +74,17 @@ async def set_currency_handler(message: types.Message, state: FSMContext, i18n:
             message=message,
             state=state,
             i18n=i18n,
-            answer_text=i18n.get("ERROR_USER_INFO"),
+            answer_key="ERROR_USER_INFO",
             ensure_safe_exit=_ensure_safe_exit,
         )
         return
 
     currency = message.text
     if not currency:
-        await handle_error_situation(message, state, i18n, i18n.get("ERROR_CURRENCY"), _ensure_safe_exit)
+        await handle_error_situation(message, state, i18n, "ERROR_CURRENCY", _ensure_safe_exit)
         return
 
-    await state.update_data(currency=currency)
-    await state.set_state(ChangeCurrencyStatesGroup.confirming_currency_change)
+    await set_state_and_update_data(state, confirming_currency_change, currency=currency)
     await message.answer(
         i18n.get("CONFIRM_CURRENCY_CHANGE", currency=currency),
         reply_markup=get_confirmation_inline_keyboard_markup(
@@ -86,8 +95,10 @@ async def set_currency_handler(message: types.Message, state: FSMContext, i18n:
     )
 
 
-@change_currency_router.callback_query(ChangeCurrencyStatesGroup.confirming_currency_change, F.data == "confirm")
-@change_currency_router.callback_query(ChangeCurrencyStatesGroup.confirming_currency_change, F.data == "cancel")
+@change_currency_router.callback_query(
+    confirming_currency_change,
+    F.data.in_(CONFIRMATION_CALLBACK_DATA),
+)
 async def handle_confirmation(callback_query: types.CallbackQuery, state: FSMContext, i18n: I18nContext) -> None:
     """Handle the confirmation callback query in the settings menu for changing currency.
 
@@ -100,6 +111,8 @@ async def handle_confirmation(callback_query: types.CallbackQuery, state: FSMCon
         state (FSMContext): The finite state machine context for managing user states.
         i18n (I18nContext): The internationalization context for retrieving localized messages.
     """
+    # The callback is acknowledged before the database work so the button stops loading right away.
+    await callback_query.answer()
     if not isinstance(callback_query.message, types.Message):
         return
     if not (callback_query.data and callback_query.from_user):
@@ -107,17 +120,19 @@ async def handle_confirmation(callback_query: types.CallbackQuery, state: FSMCon
             message=callback_query.message,
             state=state,
             i18n=i18n,
-            answer_text=i18n.get("ERROR_USER_INFO"),
+            answer_key="ERROR_USER_INFO",
             ensure_safe_exit=_ensure_safe_exit,
         )
         return
-    if callback_query.data == "cancel":
-        await _handle_cancel(callback_query, state, i18n)
-        return
-    await _handle_confirm(callback_query, state, i18n)
+    await _CONFIRMATION_ACTIONS[callback_query.data](callback_query, callback_query.message, state, i18n)
 
 
-async def _handle_cancel(callback_query: types.CallbackQuery, state: FSMContext, i18n: I18nContext) -> None:
+async def _handle_cancel(
+    callback_query: types.CallbackQuery,  # noqa: ARG001
+    message: types.Message,
+    state: FSMContext,
+    i18n: I18nContext,
+) -> None:
     """Handle the cancellation of the currency change process.
 
     This function ensures a safe exit from the current state and sends a cancellation
@@ -126,54 +141,59 @@ async def _handle_cancel(callback_query: types.CallbackQuery, state: FSMContext,
     Args:
         callback_query (types.CallbackQuery): The callback query object containing
             information about the user's interaction.
+        message (types.Message): The message the confirmation keyboard is attached to.
         state (FSMContext): The finite state machine context for managing user states.
         i18n (I18nContext): The internationalization context for retrieving localized messages.
     """
     await _ensure_safe_exit(state)
-    if not callback_query.message:
-        return
-    await callback_query.message.answer(
-        i18n.get("CANCELLED_CHANGE_CURRENCY"),
+    await message.answer(
+        get_static_text("CANCELLED_CHANGE_CURRENCY", i18n.locale),
         reply_markup=get_settings_menu_keyboard(i18n),
     )
 
 
-async def _handle_confirm(callback_query: types.CallbackQuery, state: FSMContext, i18n: I18nContext) -> None:
+async def _handle_confirm(
+    callback_query: types.CallbackQuery,
+    message: types.Message,
+    state: FSMContext,
+    i18n: I18nContext,
+) -> None:
     """Handle the confirmation of a currency change in the settings menu.
 
     Args:
         callback_query (types.CallbackQuery): The callback query object triggered by the user interaction.
+        message (types.Message): The message the confirmation keyboard is attached to.
         state (FSMContext): The finite state machine context for managing user states.
         i18n (I18nContext): The internationalization context for retrieving localized messages.
     """
-    if not callback_query.message or not isinstance(callback_query.message, types.Message):
-        return
     state_data = await state.get_data()
     user_tg_id = callback_query.from_user.id
     currency = state_data.get("currency")
-    if not all([user_tg_id, currency]):
+    if not (user_tg_id and currency):
         await handle_error_situation(
-            message=callback_query.message,
+            message=message,
             state=state,
             i18n=i18n,
-            answer_text=i18n.get("ERROR_UNKNOWN"),
+            answer_key="ERROR_UNKNOWN",
             ensure_safe_exit=_ensure_safe_exit,
         )
         return
     await _ensure_safe_exit(state)
     try:
-        # pyright do not understand not all() operation
-        await set_currency_by_tg_id(user_tg_id, currency)  # pyright: ignore[reportArgumentType]
+        await set_currency_by_tg_id(user_tg_id, currency)
     except UserConfigNotChangedError:
         await handle_error_situation(
-            message=callback_query.message,
+            message=message,
             state=state,
             i18n=i18n,
-            answer_text=i18n.get("ERROR_UNKNOWN"),
+            answer_key="ERROR_UNKNOWN",
             ensure_safe_exit=_ensure_safe_exit,
         )
         return
-    await callback_query.message.answer(i18n.get("CURRENCY_CHANGED"), reply_markup=get_settings_menu_keyboard(i18n))
+    await message.answer(
+        get_static_text("CURRENCY_CHANGED", i18n.locale),
+        reply_markup=get_settings_menu_keyboard(i18n),
+    )
 
 
 async def _ensure_safe_exit(state: FSMContext) -> None:
@@ -182,5 +202,11 @@ async def _ensure_safe_exit(state: FSMContext) -> None:
     Args:
         state (FSMContext): The finite state machine context to be reset.
     """
-    await state.update_data(currency=None)
-    await state.set_state(settings_menu)
+    await set_state_and_update_data(state, settings_menu, currency=None)
+
+
+# Maps the confirmation callback data to the function handling it.
+_CONFIRMATION_ACTIONS = MappingProxyType({
+    "confirm": _handle_confirm,
+    "cancel": _handle_cancel,
+})
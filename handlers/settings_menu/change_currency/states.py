@@ -1,16 +1,18 @@
-"""States for changing the currency in the settings menu."""
-from aiogram.fsm.state import State, StatesGroup
+"""States for changing the currency in the settings menu.
 
+The states keep the "ChangeCurrencyStatesGroup" group name, so the state values already saved
+in the FSM storage stay valid.
 
-class ChangeCurrencyStatesGroup(StatesGroup):
-    """A class representing the states for changing the currency in the settings menu.
+Attributes:
+    CHANGE_CURRENCY_STATES_GROUP_NAME (str): The group name prefixed to the state values.
+    waiting_for_currency (State): Represents the state where the bot is waiting for
+        the user to input the desired currency.
+    confirming_currency_change (State): Represents the state where the bot is waiting
+        for the user to confirm the currency change.
+"""
+from aiogram.fsm.state import State
 
-    Attributes:
-        waiting_for_currency (State): Represents the state where the bot is waiting for
-            the user to input the desired currency.
-        confirming_currency_change (State): Represents the state where the bot is waiting
-            for the user to confirm the currency change.
-    """
+CHANGE_CURRENCY_STATES_GROUP_NAME = "ChangeCurrencyStatesGroup"
 
-    waiting_for_currency = State()
-    confirming_currency_change = State()
+waiting_for_currency = State("waiting_for_currency", group_name=CHANGE_CURRENCY_STATES_GROUP_NAME)
+confirming_currency_change = State("confirming_currency_change", group_name=CHANGE_CURRENCY_STATES_GROUP_NAME)
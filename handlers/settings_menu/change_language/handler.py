@@ -1,18 +1,23 @@
 """Module contains handler for changing the language settings for users."""
 from aiogram import F, Router, types  # noqa: WPS347
 from aiogram.fsm.context import FSMContext
-from aiogram_i18n import I18nContext, LazyProxy
+from aiogram_i18n import I18nContext
 
 from config import LANGUAGES
 from handlers.error_utils import handle_error_situation
+from handlers.filters import LocalizedTextFilter
+from handlers.handlers_utils import get_static_text
 from handlers.keyboards import get_language_inline_keyboard, get_settings_menu_keyboard
 from handlers.settings_menu.change_language.states import waiting_for_language
 from handlers.settings_menu.states import settings_menu
+from handlers.state_utils import set_state_and_update_data
 
 change_language_router: Router = Router()
 
+CHANGE_LANGUAGE_MENU_BUTTON_FILTER = LocalizedTextFilter("CHANGE_LANGUAGE_MENU_BUTTON")
 
-@change_language_router.message(settings_menu, F.text == LazyProxy("CHANGE_LANGUAGE_MENU_BUTTON"))
+
+@change_language_router.message(settings_menu, CHANGE_LANGUAGE_MENU_BUTTON_FILTER)
 async def change_language_handler(message: types.Message, state: FSMContext, i18n: I18nContext) -> None:
     """Handle change of the language settings of the user.
 
@@ -22,13 +27,13 @@ async def change_language_handler(message: types.Message, state: FSMContext, i18
         i18n (I18nContext): The internationalization context for retrieving localized messages.
     """
     if message.from_user is None:
-        await handle_error_situation(message, state, i18n, i18n.get("ERROR_USER_INFO"), _ensure_safe_exit)
+        await handle_error_situation(message, state, i18n, "ERROR_USER_INFO", _ensure_safe_exit)
         return
 
     await state.set_state(waiting_for_language)
 
     await message.answer(
-        i18n.get("CHOOSE_LANGAUGE_MESSAGE"),
+        get_static_text("CHOOSE_LANGAUGE_MESSAGE", i18n.locale),
         reply_markup=get_language_inline_keyboard(),
     )
 
@@ -49,10 +54,12 @@ async def set_language_handler(callback_query: types.CallbackQuery, state: FSMCo
     if not language:
         return
 
-    await i18n.set_locale(language)
+    # Re-selecting the current language must not cost a write to the storage.
+    if i18n.locale != language:
+        await i18n.set_locale(language)
     await _ensure_safe_exit(state)
     await callback_query.message.answer(
-        i18n.get("LANGUAGE_CHANGED"),
+        get_static_text("LANGUAGE_CHANGED", i18n.locale),
         reply_markup=get_settings_menu_keyboard(i18n),
     )
 
@@ -63,5 +70,4 @@ async def _ensure_safe_exit(state: FSMContext) -> None:
     Args:
         state (FSMContext): The finite state machine context to be reset.
     """
-    await state.update_data(language=None)
-    await state.set_state(settings_menu)
+    await set_state_and_update_data(state, settings_menu, language=None)
@@ -0,0 +1,66 @@
+"""Module provides helpers for batching finite state machine storage operations.
+
+Every ``FSMContext`` call is a separate round-trip to the storage backend, so handlers that switch
+the state and reset their data at once pay for several round-trips. The helpers below fuse such
+operations into a single Redis pipeline when the Redis storage is used.
+"""
+from typing import Any
+
+from aiogram.fsm.context import FSMContext
+from aiogram.fsm.state import State
+from aiogram.fsm.storage.redis import RedisStorage
+
+
+async def set_state_and_update_data(state: FSMContext, new_state: State, **state_fields: Any) -> None:  # noqa: ANN401
+    """Set a new state and update the state data, writing both to the storage at once.
+
+    The current data is read once, merged with the given fields and written together with the state
+    by ``set_state_and_data``.
+
+    Args:
+        state (FSMContext): The finite state machine context to be changed.
+        new_state (State): The state to switch to.
+        **state_fields (Any): The state data fields to update.
+    """
+    state_data = await state.get_data()
+    state_data.update(state_fields)
+    await set_state_and_data(state, new_state, state_data)
+
+
+async def set_state_and_data(state: FSMContext, new_state: State, state_data: dict[str, Any]) -> None:
+    """Set a new state and replace the state data, writing both to the storage at once.
+
+    With a Redis storage, the state and the data are written in a single pipeline. Any other storage
+    falls back to the regular ``FSMContext`` calls.
+
+    Args:
+        state (FSMContext): The finite state machine context to be changed.
+        new_state (State): The state to switch to.
+        state_data (dict[str, Any]): The complete state data to store.
+    """
+    storage = state.storage
+    if not isinstance(storage, RedisStorage):
+        await state.set_state(new_state)
+        await state.set_data(state_data)
+        return
+    state_key = storage.key_builder.build(state.key, "state")
+    data_key = storage.key_builder.build(state.key, "data")
+    data_payload = storage.json_dumps(state_data)
+    async with storage.redis.pipeline(transaction=True) as pipeline:
+        pipeline.set(state_key, str(new_state.state), ex=storage.state_ttl)
+        pipeline.set(data_key, data_payload, ex=storage.data_ttl)
+        await pipeline.execute()
+
+
+async def get_state_fields(state: FSMContext, *fields: str) -> tuple[Any, ...]:
+    """Retrieve several fields of the state data with a single storage read.
+
+    Args:
+        state (FSMContext): The finite state machine context to read from.
+        *fields (str): The names of the state data fields to retrieve.
+
+    Returns:
+        tuple[Any, ...]: The values of the requested fields in the same order, None for missing fields.
+    """
+    state_data = await state.get_data()
+    return tuple(state_data.get(field) for field in fields)
@@ -1,21 +1,25 @@
 """Module contains the handlers for the custom statistics menu in the Telegram bot."""
-from datetime import datetime
+import asyncio
 
 from aiogram import F, Router, types  # noqa: WPS347
 from aiogram.fsm.context import FSMContext
-from aiogram_i18n import I18nContext, LazyProxy
+from aiogram.utils.callback_answer import CallbackAnswerMiddleware
+from aiogram_i18n import I18nContext
 
 from handlers.error_utils import handle_error_situation
-from handlers.handlers_utils import SelectedCategory, get_navigation_inline_keyboard
+from handlers.filters import SELECTED_CATEGORY_FILTER, CallbackMessageFilter, LocalizedTextFilter
+from handlers.handlers_utils import get_static_text
 from handlers.keyboards import get_statistics_menu_keyboard
+from handlers.state_utils import set_state_and_data, set_state_and_update_data
 from handlers.statistics_menu import statistics_utils
 from handlers.statistics_menu.custom_statistics.constants import (
     ALL_CATEGORIES_NAME,
     CATEGORIES_CHOOSE_PAGES_NAVIGATION,
     CUSTOM_PERIODS,
+    CUSTOM_PERIODS_CALLBACK_DATA,
     DEFAULT_PERIODS,
+    DEFAULT_PERIODS_CALLBACK_DATA,
     END_CATEGORIES_SELECT_CALLBACK_DATA,
-    STATISTICS_CATEGORIES_PAGES_NAVIGATION,
 )
 from handlers.statistics_menu.custom_statistics.states import CustomStatisticsStatesGroup
 from handlers.statistics_menu.states import statistics_menu
@@ -23,8 +27,10 @@ from services.expenses_service import ALL_CATEGORIES_ID
 
 custom_statistics_router: Router = Router()
 
+SHOW_CUSTOM_EXPENSES_STATISTICS_BUTTON_FILTER = LocalizedTextFilter("SHOW_CUSTOM_EXPENSES_STATISTICS_BUTTON")
 
-@custom_statistics_router.message(statistics_menu, F.text == LazyProxy("SHOW_CUSTOM_EXPENSES_STATISTICS_BUTTON"))
+
+@custom_statistics_router.message(statistics_menu, SHOW_CUSTOM_EXPENSES_STATISTICS_BUTTON_FILTER)
 async def custom_statistics_handler(message: types.Message, state: FSMContext, i18n: I18nContext) -> None:
     """Handle the custom statistics menu interaction.
 
@@ -43,14 +49,14 @@ async def custom_statistics_handler(message: types.Message, state: FSMContext, i
             message=message,
             state=state,
             i18n=i18n,
-            answer_text=i18n.get("ERROR_USER_INFO"),
+            answer_key="ERROR_USER_INFO",
             ensure_safe_exit=statistics_utils.ensure_safe_exit,
         )
         return
     await state.set_state(CustomStatisticsStatesGroup.waiting_for_period)
 
     await message.answer(
-        text=i18n.get("CHOOSE_EXPENSE_CUSTOM_STATISTICS_PERIOD"),
+        text=get_static_text("CHOOSE_EXPENSE_CUSTOM_STATISTICS_PERIOD", i18n.locale),
         reply_markup=statistics_utils.get_period_inline_keyboard_markup(
             i18n=i18n,
             custom_periods=CUSTOM_PERIODS,
@@ -61,10 +67,11 @@ async def custom_statistics_handler(message: types.Message, state: FSMContext, i
 
 @custom_statistics_router.callback_query(
     CustomStatisticsStatesGroup.waiting_for_period,
-    F.data.in_(DEFAULT_PERIODS.values()),
+    F.data.in_(DEFAULT_PERIODS_CALLBACK_DATA),
 )
 async def handle_default_period_selection(
     callback_query: types.CallbackQuery,
+    message: types.Message,
     state: FSMContext,
     i18n: I18nContext,
 ) -> None:
@@ -78,33 +85,35 @@ async def handle_default_period_selection(
     Args:
         callback_query (types.CallbackQuery): The callback query object containing
             the user's selection and related metadata.
+        message (types.Message): The message with the inline keyboard the callback came from.
         state (FSMContext): The finite state machine context for managing user states.
         i18n (I18nContext): The internationalization context for retrieving localized
             messages.
     """
-    if not callback_query.message or not isinstance(callback_query.message, types.Message):
-        return
-    await state.update_data(period=callback_query.data)
-    await state.set_state(CustomStatisticsStatesGroup.selecting_categories)
-    await callback_query.message.answer(
-        i18n.get("CHOOSE_EXPENSE_CUSTOM_STATISTICS_CATEGORIES"),
-        reply_markup=await statistics_utils.get_categories_inline_keyboard_markup(
+    # the state is written while the categories keyboard is built, so it is in place before the keyboard is sent
+    _, categories_markup = await asyncio.gather(
+        set_state_and_update_data(state, CustomStatisticsStatesGroup.selecting_categories, period=callback_query.data),
+        statistics_utils.get_categories_inline_keyboard_markup(
             tg_id=callback_query.from_user.id,
             page=0,
             i18n=i18n,
             categories_choose_pages_navigation=CATEGORIES_CHOOSE_PAGES_NAVIGATION,
-            all_categories_name=ALL_CATEGORIES_NAME,
             end_categories_select_callback_data=END_CATEGORIES_SELECT_CALLBACK_DATA,
         ),
     )
+    await message.answer(
+        get_static_text("CHOOSE_EXPENSE_CUSTOM_STATISTICS_CATEGORIES", i18n.locale),
+        reply_markup=categories_markup,
+    )
 
 
 @custom_statistics_router.callback_query(
     CustomStatisticsStatesGroup.waiting_for_period,
-    F.data.in_(CUSTOM_PERIODS.values()),
+    F.data.in_(CUSTOM_PERIODS_CALLBACK_DATA),
 )
 async def handle_custom_period_selection(
-    callback_query: types.CallbackQuery,
+    callback_query: types.CallbackQuery,  # noqa: ARG001
+    message: types.Message,
     state: FSMContext,
     i18n: I18nContext,
 ) -> None:
@@ -118,15 +127,14 @@ async def handle_custom_period_selection(
     Args:
         callback_query (types.CallbackQuery): The callback query object containing
             information about the user's interaction.
+        message (types.Message): The message with the inline keyboard the callback came from.
         state (FSMContext): The finite state machine context for managing the
             current state of the user.
         i18n (I18nContext): The internationalization context for retrieving
             localized messages.
     """
-    if not callback_query.message or not isinstance(callback_query.message, types.Message):
-        return
     await state.set_state(CustomStatisticsStatesGroup.waiting_for_custom_period_start)
-    await callback_query.message.answer(i18n.get("INPUT_CUSTOM_PERIOD_START_DATE"))
+    await message.answer(get_static_text("INPUT_CUSTOM_PERIOD_START_DATE", i18n.locale))
 
 
 @custom_statistics_router.message(CustomStatisticsStatesGroup.waiting_for_custom_period_start)
@@ -142,37 +150,17 @@ async def handle_custom_period_start_date(message: types.Message, state: FSMCont
         state (FSMContext): The finite state machine context for managing user states.
         i18n (I18nContext): The internationalization context for retrieving localized messages.
     """
-    if not message.from_user:
-        await handle_error_situation(
-            message=message,
-            state=state,
-            i18n=i18n,
-            answer_text=i18n.get("ERROR_USER_INFO"),
-            ensure_safe_exit=statistics_utils.ensure_safe_exit,
-        )
-        return
-    if not message.text:
-        await handle_error_situation(
-            message=message,
-            state=state,
-            i18n=i18n,
-            answer_text=i18n.get("ERROR_DATE"),
-        )
-        return
-    try:
-        datetime.strptime(message.text, "%d.%m.%Y").date()  # noqa: DTZ007
-    except ValueError:
-        await handle_error_situation(
-            message=message,
-            state=state,
-            i18n=i18n,
-            answer_text=i18n.get("ERROR_DATE_NOT_VALID"),
-        )
+    date_input = await _get_date_input_or_send_error(message, state, i18n)
+    if date_input is None:
         return
-
-    await state.update_data(custom_period_start_date=message.text)
-    await state.set_state(CustomStatisticsStatesGroup.waiting_for_custom_period_end)
-    await message.answer(i18n.get("INPUT_CUSTOM_PERIOD_END_DATE"))
+    _, start_date_ordinal = date_input
+    # the prompt is sent only once the state is written, so an immediate reply finds the end date state
+    await set_state_and_update_data(
+        state,
+        CustomStatisticsStatesGroup.waiting_for_custom_period_end,
+        custom_period_start_date=start_date_ordinal,
+    )
+    await message.answer(get_static_text("INPUT_CUSTOM_PERIOD_END_DATE", i18n.locale))
 
 
 @custom_statistics_router.message(CustomStatisticsStatesGroup.waiting_for_custom_period_end)
@@ -188,203 +176,122 @@ async def handle_custom_period_end_date(message: types.Message, state: FSMContex
         state (FSMContext): The finite state machine context for managing conversation states.
         i18n (I18nContext): The internationalization context for retrieving localized messages.
     """
-    if not message.from_user:
-        await handle_error_situation(
-            message=message,
-            state=state,
-            i18n=i18n,
-            answer_text=i18n.get("ERROR_USER_INFO"),
-            ensure_safe_exit=statistics_utils.ensure_safe_exit,
-        )
+    date_input = await _get_date_input_or_send_error(message, state, i18n)
+    if date_input is None:
         return
-    if not message.text:
-        await handle_error_situation(
-            message=message,
-            state=state,
-            i18n=i18n,
-            answer_text=i18n.get("ERROR_DATE"),
-        )
-        return
-    try:
-        datetime.strptime(message.text, "%d.%m.%Y").date()  # noqa: DTZ007
-    except ValueError:
-        await handle_error_situation(
-            message=message,
-            state=state,
-            i18n=i18n,
-            answer_text=i18n.get("ERROR_DATE_NOT_VALID"),
-        )
-        return
-
-    await state.update_data(custom_period_end_date=message.text)
-    await state.set_state(CustomStatisticsStatesGroup.selecting_categories)
-    await message.answer(
-        i18n.get("CHOOSE_EXPENSE_CUSTOM_STATISTICS_CATEGORIES"),
-        reply_markup=await statistics_utils.get_categories_inline_keyboard_markup(
-            tg_id=message.from_user.id,
+    user_id, end_date_ordinal = date_input
+    # the state is written while the categories keyboard is built, so it is in place before the keyboard is sent
+    _, categories_markup = await asyncio.gather(
+        set_state_and_update_data(
+            state,
+            CustomStatisticsStatesGroup.selecting_categories,
+            custom_period_end_date=end_date_ordinal,
+        ),
+        statistics_utils.get_categories_inline_keyboard_markup(
+            tg_id=user_id,
             page=0,
             i18n=i18n,
             categories_choose_pages_navigation=CATEGORIES_CHOOSE_PAGES_NAVIGATION,
-            all_categories_name=ALL_CATEGORIES_NAME,
             end_categories_select_callback_data=END_CATEGORIES_SELECT_CALLBACK_DATA,
         ),
     )
+    await message.answer(
+        get_static_text("CHOOSE_EXPENSE_CUSTOM_STATISTICS_CATEGORIES", i18n.locale),
+        reply_markup=categories_markup,
+    )
 
 
 @custom_statistics_router.callback_query(
-    F.data == "next_page_choose_category",
+    F.data.in_(CATEGORIES_CHOOSE_PAGES_NAVIGATION.callback_data),
     CustomStatisticsStatesGroup.selecting_categories,
 )
-async def next_page_choose_category_button_handler(
+async def choose_category_page_button_handler(
     callback_query: types.CallbackQuery,
+    message: types.Message,
     state: FSMContext,
     i18n: I18nContext,
 ) -> None:
-    """Handle the "next page" button press in the category selection menu.
-
-    This function updates the current page index for the category selection menu
-    in the user's state. If the user is already on the last page, it resets the
-    page index to the first page. Otherwise, it increments the page index by one.
-    After updating the state, it calls a helper function to handle the updated
-    category list display.
+    """Handle the "previous page" and "next page" buttons in the category selection menu.
 
     Args:
         callback_query (types.CallbackQuery): The callback query object containing
             information about the button press event.
+        message (types.Message): The message with the inline keyboard the callback came from.
         state (FSMContext): The finite state machine context for managing user-specific
             state data.
         i18n (I18nContext): The internationalization context for handling localized
             messages.
     """
-    if not isinstance(callback_query.message, types.Message):
-        return
-    # it takes user_id from callback query, not message, because user_id from message is nonsense
-    user_id = callback_query.from_user.id
-    state_data = await state.get_data()
-    current_page = state_data.get("current_page_choose_category", 0)
-    last_page = state_data.get("last_page_choose_category", 0)
-    if current_page == last_page:
-        await state.update_data(current_page_choose_category=0)
-    else:
-        await state.update_data(current_page_choose_category=current_page + 1)
-
-    await statistics_utils.handle_categories_list(
-        user_id=user_id,
-        message=callback_query.message,
+    await statistics_utils.turn_categories_page(
+        callback_query=callback_query,
+        message=message,
         state=state,
         i18n=i18n,
         categories_choose_pages_navigation=CATEGORIES_CHOOSE_PAGES_NAVIGATION,
-        all_categories_name=ALL_CATEGORIES_NAME,
         end_categories_select_callback_data=END_CATEGORIES_SELECT_CALLBACK_DATA,
     )
 
 
 @custom_statistics_router.callback_query(
-    F.data == "prev_page_choose_category",
     CustomStatisticsStatesGroup.selecting_categories,
+    SELECTED_CATEGORY_FILTER,
 )
-async def prev_page_choose_category_button_handler(
+async def handle_category(
     callback_query: types.CallbackQuery,
+    message: types.Message,
     state: FSMContext,
     i18n: I18nContext,
 ) -> None:
-    """Handle the "previous page" button press in the category selection menu.
-
-    This function updates the current page in the state to the previous page
-    or wraps around to the last page if the current page is the first one.
-    It then calls a helper function to update the category list display.
+    """Handle the selection of a category in the statistics menu.
 
     Args:
-        callback_query (types.CallbackQuery): The callback query object containing
-            information about the button press event.
+        callback_query (types.CallbackQuery): The callback query object containing data about the user's interaction.
+        message (types.Message): The message with the inline keyboard the callback came from.
         state (FSMContext): The finite state machine context for managing user state.
-        i18n (I18nContext): The internationalization context for handling translations.
+        i18n (I18nContext): The internationalization context for retrieving localized strings.
     """
-    if not isinstance(callback_query.message, types.Message):
-        return
-    # it takes user_id from callback query, not message, because user_id from message is nonsense
-    user_id = callback_query.from_user.id
-    state_data = await state.get_data()
-    current_page = state_data.get("current_page_choose_category", 0)
-    last_page = state_data.get("last_page_choose_category", 0)
-
-    if current_page == 0:
-        await state.update_data(current_page_choose_category=last_page)
-    else:
-        await state.update_data(current_page_choose_category=current_page - 1)
-
-    await statistics_utils.handle_categories_list(
-        user_id=user_id,
-        message=callback_query.message,
+    selected_category = await statistics_utils.get_selected_category_or_send_error(
+        callback_query=callback_query,
+        message=message,
         state=state,
         i18n=i18n,
-        categories_choose_pages_navigation=CATEGORIES_CHOOSE_PAGES_NAVIGATION,
         all_categories_name=ALL_CATEGORIES_NAME,
-        end_categories_select_callback_data=END_CATEGORIES_SELECT_CALLBACK_DATA,
     )
-
-
-@custom_statistics_router.callback_query(
-    CustomStatisticsStatesGroup.selecting_categories,
-    (F.data.not_contains("page") & F.data != END_CATEGORIES_SELECT_CALLBACK_DATA),
-)
-async def handle_category(callback_query: types.CallbackQuery, state: FSMContext, i18n: I18nContext) -> None:
-    """Handle the selection of a category in the statistics menu.
-
-    Args:
-        callback_query (types.CallbackQuery): The callback query object containing data about the user's interaction.
-        state (FSMContext): The finite state machine context for managing user state.
-        i18n (I18nContext): The internationalization context for retrieving localized strings.
-    """
-    if not isinstance(callback_query.message, types.Message):
-        return
-    if not (callback_query.data and callback_query.from_user and callback_query.message):
-        await handle_error_situation(
-            message=callback_query.message,
-            state=state,
-            i18n=i18n,
-            answer_text=i18n.get("ERROR_USER_INFO"),
-            ensure_safe_exit=statistics_utils.ensure_safe_exit,
-        )
+    if selected_category is None:
         return
-    callback_data = SelectedCategory.unpack(callback_query.data)
-    category_id = callback_data.category_id
-    category_name = callback_data.category_name
-    if not (category_name and category_id):
-        await handle_error_situation(
-            message=callback_query.message,
-            state=state,
-            i18n=i18n,
-            answer_text=i18n.get("ERROR_UNKNOWN"),
-            ensure_safe_exit=statistics_utils.ensure_safe_exit,
-        )
-        return
-    state_data = await state.get_data()
-
-    categories: dict[int, str] = state_data.get("categories", {})
-    categories[category_id] = category_name
-    await state.update_data(categories=categories)
+    category_id, category_name = selected_category
     if category_id != ALL_CATEGORIES_ID:
+        await statistics_utils.add_selected_category(state, category_id, category_name)
         return
-    await state.set_state(statistics_menu)
-    await callback_query.message.answer(
-        i18n.get("WAIT_FOR_CUSTOM_STATISTICS"),
+    # all categories end the selection, so the category and the menu state are written at once
+    # and the statistics are built from the same data without reading it again
+    state_data = await state.get_data()
+    statistics_utils.select_category(state_data, category_id, category_name)
+    await set_state_and_data(state, statistics_menu, state_data)
+    await message.answer(
+        get_static_text("WAIT_FOR_CUSTOM_STATISTICS", i18n.locale),
         reply_markup=get_statistics_menu_keyboard(i18n),
     )
     await statistics_utils.send_statistics(
         user_id=callback_query.from_user.id,
-        message=callback_query.message,
+        message=message,
         state=state,
         i18n=i18n,
-        statistics_navigation_callback_data=STATISTICS_CATEGORIES_PAGES_NAVIGATION,
+        statistics_navigation_callback_data=statistics_utils.STATISTICS_CATEGORIES_PAGES_NAVIGATION,
+        state_data=state_data,
     )
 
 
 @custom_statistics_router.callback_query(
     CustomStatisticsStatesGroup.selecting_categories,
-    (F.data.not_contains("page") & F.data == END_CATEGORIES_SELECT_CALLBACK_DATA),
+    F.data == END_CATEGORIES_SELECT_CALLBACK_DATA,
 )
-async def handle_end_category_select(callback_query: types.CallbackQuery, state: FSMContext, i18n: I18nContext) -> None:
+async def handle_end_category_select(
+    callback_query: types.CallbackQuery,
+    message: types.Message,
+    state: FSMContext,
+    i18n: I18nContext,
+) -> None:
     """Handle the end of category selection in the custom statistics menu.
 
     This function processes the callback query when a user selects a category
@@ -396,145 +303,100 @@ async def handle_end_category_select(callback_query: types.CallbackQuery, state:
     Args:
         callback_query (types.CallbackQuery): The callback query object
             containing information about the user's interaction.
+        message (types.Message): The message with the inline keyboard the callback came from.
         state (FSMContext): The finite state machine context for managing
             user states.
         i18n (I18nContext): The internationalization context for retrieving
             localized messages.
     """
-    if not isinstance(callback_query.message, types.Message):
-        return
-    if not (callback_query.data and callback_query.from_user and callback_query.message):
+    if not (callback_query.data and callback_query.from_user):
         await handle_error_situation(
-            message=callback_query.message,
+            message=message,
             state=state,
             i18n=i18n,
-            answer_text=i18n.get("ERROR_USER_INFO"),
+            answer_key="ERROR_USER_INFO",
             ensure_safe_exit=statistics_utils.ensure_safe_exit,
         )
         return
     await state.set_state(statistics_menu)
-    await callback_query.message.answer(i18n.get("WAIT_FOR_CUSTOM_STATISTICS"))
+    await message.answer(get_static_text("WAIT_FOR_CUSTOM_STATISTICS", i18n.locale))
     await statistics_utils.send_statistics(
         user_id=callback_query.from_user.id,
-        message=callback_query.message,
+        message=message,
         state=state,
         i18n=i18n,
-        statistics_navigation_callback_data=STATISTICS_CATEGORIES_PAGES_NAVIGATION,
+        statistics_navigation_callback_data=statistics_utils.STATISTICS_CATEGORIES_PAGES_NAVIGATION,
     )
 
 
 @custom_statistics_router.callback_query(
-    F.data == "next_page_category_expenses",
+    F.data.in_(statistics_utils.STATISTICS_CATEGORIES_PAGES_NAVIGATION.callback_data),
     statistics_menu,
 )
-async def next_page_category_expenses_button_handler(
+async def category_expenses_page_button_handler(
     callback_query: types.CallbackQuery,
+    message: types.Message,
     state: FSMContext,
     i18n: I18nContext,
 ) -> None:
-    """Handle the navigation to the next page of category expenses in a statistics menu.
-
-    This function is triggered when the user interacts with a button to navigate to the next page
-    of category expenses. It updates the current page in the state, retrieves the statistics pages,
-    and updates the message text with the content of the new page.
+    """Handle the "previous page" and "next page" buttons of the category expenses statistics.
 
     Args:
         callback_query (types.CallbackQuery): The callback query object containing information
             about the user's interaction with the inline button.
+        message (types.Message): The message with the inline keyboard the callback came from.
         state (FSMContext): The finite state machine context for storing and retrieving user-specific
             data during the bot's operation.
         i18n (I18nContext): The internationalization context for retrieving localized strings.
     """
-    if not isinstance(callback_query.message, types.Message):
-        return
-    # it takes user_id from callback query, not message, because user_id from message is nonsense
-    user_id = callback_query.from_user.id
-    state_data = await state.get_data()
-    current_page = state_data.get("current_page_category_expenses", 0)
-    last_page = state_data.get("last_page_category_expenses", 0)
-    if current_page == last_page:
-        current_page = 0
-    else:
-        current_page += 1
-    await state.update_data(current_page_category_expenses=current_page)
-
-    statististics_pages = await statistics_utils.get_statistics_pages(user_id, callback_query.message, state, i18n)
-    if not statististics_pages:
-        await handle_error_situation(
-            message=callback_query.message,
-            state=state,
-            i18n=i18n,
-            answer_text=i18n.get("ERROR_NO_STATISTICS"),
-            ensure_safe_exit=statistics_utils.ensure_safe_exit,
-        )
-        return
-    await callback_query.message.edit_text(
-        text=statististics_pages[current_page],
-        reply_markup=types.InlineKeyboardMarkup(
-            inline_keyboard=[
-                get_navigation_inline_keyboard(
-                    page=current_page,
-                    total_pages=len(statististics_pages),
-                    navigation_callback_data=STATISTICS_CATEGORIES_PAGES_NAVIGATION,
-                ),
-            ],
-        ),
+    await statistics_utils.turn_statistics_page(
+        callback_query=callback_query,
+        message=message,
+        state=state,
+        i18n=i18n,
+        statistics_navigation_callback_data=statistics_utils.STATISTICS_CATEGORIES_PAGES_NAVIGATION,
     )
 
 
-@custom_statistics_router.callback_query(
-    F.data == "prev_page_category_expenses",
-    statistics_menu,
-)
-async def prev_page_category_expenses_button_handler(
-    callback_query: types.CallbackQuery,
+async def _get_date_input_or_send_error(
+    message: types.Message,
     state: FSMContext,
     i18n: I18nContext,
-) -> None:
-    """Handle the "previous page" button for navigating category expenses statistics.
+) -> tuple[int, int] | None:
+    """Validate a custom period date message and answer with the matching error if it is not valid.
 
-    This function is triggered when the user interacts with the "previous page" button
-    in the category expenses statistics menu. It updates the current page in the state
-    and displays the corresponding statistics page.
+    Both date input handlers need the same checks: the message must have sender information and text,
+    and the text must be a date in the ``DD.MM.YYYY`` format. The date is returned as the ordinal
+    the state data stores it as.
 
     Args:
-        callback_query (types.CallbackQuery): The callback query object containing information
-            about the user's interaction with the button.
-        state (FSMContext): The finite state machine context for managing user-specific data.
-        i18n (I18nContext): The internationalization context for retrieving localized strings.
+        message (types.Message): The Telegram message object containing the user's input.
+        state (FSMContext): The finite state machine context for managing user states.
+        i18n (I18nContext): The internationalization context for retrieving localized messages.
+
+    Returns:
+        tuple[int, int] | None: The sender ID and the ordinal of the parsed date, or None if an error was sent.
     """
-    if not isinstance(callback_query.message, types.Message):
-        return
-    # it takes user_id from callback query, not message, because user_id from message is nonsense
-    user_id = callback_query.from_user.id
-    state_data = await state.get_data()
-    current_page = state_data.get("current_page_category_expenses", 0)
-    last_page = state_data.get("last_page_category_expenses", 0)
-
-    if current_page == 0:
-        current_page = last_page
-    else:
-        current_page -= 1
-    await state.update_data(current_page_category_expenses=current_page)
-    statististics_pages = await statistics_utils.get_statistics_pages(user_id, callback_query.message, state, i18n)
-    if not statististics_pages:
+    if not message.from_user:
         await handle_error_situation(
-            message=callback_query.message,
+            message=message,
             state=state,
             i18n=i18n,
-            answer_text=i18n.get("ERROR_NO_STATISTICS"),
+            answer_key="ERROR_USER_INFO",
             ensure_safe_exit=statistics_utils.ensure_safe_exit,
         )
-        return
-    await callback_query.message.edit_text(
-        text=statististics_pages[current_page],
-        reply_markup=types.InlineKeyboardMarkup(
-            inline_keyboard=[
-                get_navigation_inline_keyboard(
-                    page=current_page,
-                    total_pages=len(statististics_pages),
-                    navigation_callback_data=STATISTICS_CATEGORIES_PAGES_NAVIGATION,
-                ),
-            ],
-        ),
-    )
+        return None
+    if not message.text:
+        await handle_error_situation(message, state, i18n, "ERROR_DATE")
+        return None
+    period_date = statistics_utils.parse_period_date(message.text)
+    if period_date is None:
+        await handle_error_situation(message, state, i18n, "ERROR_DATE_NOT_VALID")
+        return None
+    return message.from_user.id, period_date.toordinal()
+
+
+# Every callback is answered before its handler runs, so the pressed button stops loading right away.
+custom_statistics_router.callback_query.middleware(CallbackAnswerMiddleware(pre=True))
+# Callbacks of inaccessible messages never reach the handlers, which receive the message as ``message``.
+custom_statistics_router.callback_query.filter(CallbackMessageFilter())
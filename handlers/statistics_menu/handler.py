@@ -1,18 +1,21 @@
 """Handle the statistics menu interaction for the Telegram bot."""
-from aiogram import F, Router  # noqa: WPS347
+from aiogram import Router
 from aiogram.fsm.context import FSMContext
 from aiogram.types import Message
-from aiogram_i18n import I18nContext, LazyProxy
+from aiogram_i18n import I18nContext
 
 from handlers.basic.states import start_menu
 from handlers.error_utils import handle_error_situation
+from handlers.filters import LocalizedTextFilter
 from handlers.keyboards import get_statistics_menu_keyboard
 from handlers.statistics_menu.states import statistics_menu
 
 statistics_menu_router: Router = Router()
 
+SHOW_EXPENSES_BUTTON_FILTER = LocalizedTextFilter("SHOW_EXPENSES_BUTTON")
 
-@statistics_menu_router.message(start_menu, F.text == LazyProxy("SHOW_EXPENSES_BUTTON"))
+
+@statistics_menu_router.message(start_menu, SHOW_EXPENSES_BUTTON_FILTER)
 async def settings_menu_handler(message: Message, state: FSMContext, i18n: I18nContext) -> None:
     """Handle the settings menu interaction for the Telegram bot.
 
@@ -30,7 +33,7 @@ async def settings_menu_handler(message: Message, state: FSMContext, i18n: I18nC
             message=message,
             state=state,
             i18n=i18n,
-            answer_text=i18n.get("ERROR_USER_INFO"),
+            answer_key="ERROR_USER_INFO",
             ensure_safe_exit=_ensure_safe_exit,
         )
         return
@@ -1,31 +1,55 @@
 """Utility functions for handling custom statistics generation in the statistics menu."""
-from collections import defaultdict
+import asyncio
+from collections.abc import Mapping
 from dataclasses import dataclass
-from datetime import date, datetime
+from datetime import date
+from decimal import Decimal
+from functools import cache
+from typing import Any
 
 from aiogram import types
 from aiogram.fsm.context import FSMContext
 from aiogram_i18n import I18nContext
 from aiogram_i18n.types import InlineKeyboardMarkup
 
-from database.models import Expense
 from handlers.basic.states import start_menu
 from handlers.error_utils import handle_error_situation
 from handlers.handlers_utils import (
     NavigationCallbackData,
     SelectedCategory,
     get_categories_inline_keyboard_and_total_pages,
-    get_navigation_inline_keyboard,
+    get_categories_total_pages,
+    get_category_name,
+    get_navigation_inline_keyboard_markup,
+    get_static_text,
 )
 from services.expenses_service import (
     ALL_CATEGORIES_ID,
     ExpensePeriod,
     StatisticsNotGeneratedError,
-    get_expenses_by_category_ids_by_period,
+    get_category_currency_sums_by_period,
 )
 
+PAGE_TURN_DEBOUNCE_DELAY = 0.2
+STATISTICS_PAGES_CACHE_SIZE = 1024
 
-@dataclass
+# Navigation through the pages of the category expenses statistics, shared by both statistics menus.
+STATISTICS_CATEGORIES_PAGES_NAVIGATION = NavigationCallbackData(
+    next_page="next_page_category_expenses",
+    prev_page="prev_page_category_expenses",
+)
+
+type PeriodButtons = tuple[tuple[str, str], ...]
+
+# Maps (locale, default periods, custom periods) to the period markup built for them.
+_period_markups: dict[tuple[str, PeriodButtons, PeriodButtons], InlineKeyboardMarkup] = {}
+# Maps (chat ID, message ID) of a statistics message to the pages its pending clicks turn it by.
+_pending_page_turns: dict[tuple[int, int], int] = {}
+# Maps (chat ID, message ID) of a statistics message to its rendered pages, oldest messages first.
+_statistics_pages: dict[tuple[int, int], list[str]] = {}
+
+
+@dataclass(frozen=True, slots=True)
 class StatisticsConfig:
     """StatisticsConfig class of parameters for generating statistics.
 
@@ -56,9 +80,10 @@ async def ensure_safe_exit(state: FSMContext) -> None:
         period=None,
         custom_period_start_date=None,
         custom_period_end_date=None,
-        categories={},
+        statistics_categories=[],
         current_page_choose_category=0,
-        last_page_category_expenses=0,
+        current_page_category_expenses=0,
+        statistics_pages=None,
     )
     await state.set_state(start_menu)
 
@@ -69,6 +94,7 @@ async def send_statistics(
     state: FSMContext,
     i18n: I18nContext,
     statistics_navigation_callback_data: NavigationCallbackData,
+    state_data: dict[str, Any] | None = None,
 ) -> None:
     """Send statistical data to the user in a paginated format.
 
@@ -83,61 +109,83 @@ async def send_statistics(
         i18n (I18nContext): The internationalization context for localized messages.
         statistics_navigation_callback_data (NavigationCallbackData): Callback data
             used for navigation between statistical pages.
+        state_data (dict[str, Any] | None, optional): The state data already read by the caller.
+            If None, the state data is read from the storage.
     """
-    statististics_pages = await get_statistics_pages(user_id, message, state, i18n)
+    if state_data is None:
+        state_data = await state.get_data()
+    statististics_pages = await get_statistics_pages(user_id, message, state, i18n, state_data=state_data)
     if not statististics_pages:
         await handle_error_situation(
             message=message,
             state=state,
             i18n=i18n,
-            answer_text=i18n.get("ERROR_NO_STATISTICS"),
+            answer_key="ERROR_NO_STATISTICS",
             ensure_safe_exit=ensure_safe_exit,
         )
         return
-    await state.update_data(last_page_category_expenses=len(statististics_pages) - 1)
-    await message.answer(
+    state_data["current_page_category_expenses"] = 0
+    # the pages used to be kept in the state data, which is read on every update of the user
+    state_data.pop("statistics_pages", None)
+    await state.set_data(state_data)
+    statistics_message = await message.answer(
         text=statististics_pages[0],
-        reply_markup=types.InlineKeyboardMarkup(
-            inline_keyboard=[
-                get_navigation_inline_keyboard(
-                    page=0,
-                    total_pages=len(statististics_pages),
-                    navigation_callback_data=statistics_navigation_callback_data,
-                ),
-            ],
+        reply_markup=get_navigation_inline_keyboard_markup(
+            page=0,
+            total_pages=len(statististics_pages),
+            navigation_callback_data=statistics_navigation_callback_data,
         ),
     )
+    # the rendered pages are kept in memory, so turning a page does not generate them again
+    _store_statistics_pages(statistics_message, statististics_pages)
+
+
+def _store_statistics_pages(statistics_message: types.Message, statistics_pages: list[str]) -> None:
+    """Keep the rendered pages of a statistics message, forgetting the oldest message beyond the cache size.
+
+    Args:
+        statistics_message (types.Message): The message the pages are shown in.
+        statistics_pages (list[str]): The rendered statistics pages.
+    """
+    _statistics_pages[statistics_message.chat.id, statistics_message.message_id] = statistics_pages
+    if len(_statistics_pages) > STATISTICS_PAGES_CACHE_SIZE:
+        del _statistics_pages[next(iter(_statistics_pages))]  # noqa: WPS420
 
 
 def get_period_inline_keyboard_markup(
     i18n: I18nContext,
-    default_periods: dict[str, str],
-    custom_periods: dict[str, str],
+    default_periods: Mapping[str, str],
+    custom_periods: Mapping[str, str],
 ) -> InlineKeyboardMarkup:
     """Generate an inline keyboard markup for selecting periods.
 
     Args:
         i18n (I18nContext): The internationalization context used for translating button text.
-        default_periods (dict[str, str]): A dictionary where keys are button text identifiers
+        default_periods (Mapping[str, str]): A mapping where keys are button text identifiers
             for default periods and values are their corresponding callback data.
-        custom_periods (dict[str, str]): A dictionary where keys are button text identifiers
+        custom_periods (Mapping[str, str]): A mapping where keys are button text identifiers
             for custom periods and values are their corresponding callback data.
 
     Returns:
         InlineKeyboardMarkup: An inline keyboard markup containing buttons for both default
         and custom periods.
     """
-    period_buttons: list[list[types.InlineKeyboardButton]] = [
-        [
-            types.InlineKeyboardButton(text=i18n.get(button_text), callback_data=callback_data)
-            for button_text, callback_data in default_periods.items()
-        ],
-        [
-            types.InlineKeyboardButton(text=i18n.get(button_text), callback_data=callback_data)
-            for button_text, callback_data in custom_periods.items()
-        ],
-    ]
-    return InlineKeyboardMarkup(inline_keyboard=period_buttons)
+    cache_key = (i18n.locale, tuple(default_periods.items()), tuple(custom_periods.items()))
+    period_markup = _period_markups.get(cache_key)
+    if period_markup is None:
+        period_buttons: list[list[types.InlineKeyboardButton]] = [
+            [
+                types.InlineKeyboardButton(text=i18n.get(button_text), callback_data=callback_data)
+                for button_text, callback_data in default_periods.items()
+            ],
+            [
+                types.InlineKeyboardButton(text=i18n.get(button_text), callback_data=callback_data)
+                for button_text, callback_data in custom_periods.items()
+            ],
+        ]
+        period_markup = InlineKeyboardMarkup(inline_keyboard=period_buttons)
+        _period_markups[cache_key] = period_markup
+    return period_markup
 
 
 async def get_categories_inline_keyboard_markup(
@@ -145,7 +193,6 @@ async def get_categories_inline_keyboard_markup(
     page: int,
     i18n: I18nContext,
     categories_choose_pages_navigation: NavigationCallbackData,
-    all_categories_name: str,
     end_categories_select_callback_data: str,
     all_categories_id: int = ALL_CATEGORIES_ID,
 ) -> InlineKeyboardMarkup | None:
@@ -157,7 +204,6 @@ async def get_categories_inline_keyboard_markup(
         i18n (I18nContext): Internationalization context for retrieving localized strings.
         categories_choose_pages_navigation (NavigationCallbackData): Callback data for handling
             category navigation between pages.
-        all_categories_name (str): Display name for the "All Categories" button.
         end_categories_select_callback_data (str): Callback data for the "End Selection" button.
         all_categories_id (int, optional): ID representing all categories. Defaults to ALL_CATEGORIES_ID.
 
@@ -172,37 +218,54 @@ async def get_categories_inline_keyboard_markup(
     )
     if not inline_keyboard_markup or not total_pages:
         return None
-    inline_keyboard = inline_keyboard_markup.inline_keyboard
-    inline_keyboard_custom = [
-        [
-            types.InlineKeyboardButton(
-                text=i18n.get("ALL_CATEGORIES_BUTTON"),
-                callback_data=SelectedCategory(
-                    category_id=all_categories_id,
-                    category_name=all_categories_name,
-                ).pack(),
-            ),
-        ],
-    ]
-    inline_keyboard_custom.extend(inline_keyboard)
-    inline_keyboard_custom.append(
-        [
-            types.InlineKeyboardButton(
-                text=i18n.get("END_CATEGORIES_SELECT_BUTTON"),
-                callback_data=end_categories_select_callback_data,
-            ),
+    all_categories_button, end_categories_select_button = _get_categories_selection_buttons(
+        i18n.locale,
+        all_categories_id,
+        end_categories_select_callback_data,
+    )
+    return InlineKeyboardMarkup(
+        inline_keyboard=[
+            [all_categories_button],
+            *inline_keyboard_markup.inline_keyboard,
+            [end_categories_select_button],
         ],
     )
-    return InlineKeyboardMarkup(inline_keyboard=inline_keyboard_custom)
+
+
+@cache
+def _get_categories_selection_buttons(
+    locale: str,
+    all_categories_id: int,
+    end_categories_select_callback_data: str,
+) -> tuple[types.InlineKeyboardButton, types.InlineKeyboardButton]:
+    """Build the "All categories" and "End selection" buttons of the categories keyboard once per locale.
+
+    Args:
+        locale (str): The locale to translate the button texts to.
+        all_categories_id (int): ID representing all categories.
+        end_categories_select_callback_data (str): Callback data for the "End Selection" button.
+
+    Returns:
+        tuple[types.InlineKeyboardButton, types.InlineKeyboardButton]: The "All categories" button
+        and the "End selection" button.
+    """
+    all_categories_button = types.InlineKeyboardButton(
+        text=get_static_text("ALL_CATEGORIES_BUTTON", locale),
+        callback_data=SelectedCategory(category_id=all_categories_id).pack(),
+    )
+    end_categories_select_button = types.InlineKeyboardButton(
+        text=get_static_text("END_CATEGORIES_SELECT_BUTTON", locale),
+        callback_data=end_categories_select_callback_data,
+    )
+    return all_categories_button, end_categories_select_button
 
 
 async def handle_categories_list(
     user_id: int,
     message: types.Message,
-    state: FSMContext,
+    page: int,
     i18n: I18nContext,
     categories_choose_pages_navigation: NavigationCallbackData,
-    all_categories_name: str,
     end_categories_select_callback_data: str,
 ) -> None:
     """Handle the display and navigation of a paginated list of categories in a Telegram bot.
@@ -210,25 +273,21 @@ async def handle_categories_list(
     Args:
         user_id (int): The Telegram user ID of the user interacting with the bot.
         message (types.Message): The Telegram message object representing the user's interaction.
-        state (FSMContext): The finite state machine context for managing user states.
+        page (int): The page of the categories list to display.
         i18n (I18nContext): The internationalization context for handling translations.
         categories_choose_pages_navigation (NavigationCallbackData):
             Callback data for navigating between pages of categories.
 
-        all_categories_name (str): The name representing the "all categories" option.
         end_categories_select_callback_data (str):
             Callback data to be used when the category selection process ends.
     """
     if not message.from_user:
         return
-    state_data = await state.get_data()
-    current_page = state_data.get("current_page_choose_category") or 0
     inline_keyboard_markup = await get_categories_inline_keyboard_markup(
         tg_id=user_id,
-        page=current_page,
+        page=page,
         i18n=i18n,
         categories_choose_pages_navigation=categories_choose_pages_navigation,
-        all_categories_name=all_categories_name,
         end_categories_select_callback_data=end_categories_select_callback_data,
     )
     if not inline_keyboard_markup:
@@ -238,11 +297,282 @@ async def handle_categories_list(
     )
 
 
+async def add_selected_category(state: FSMContext, category_id: int, category_name: str) -> None:
+    """Add a category to the categories selected for the statistics.
+
+    The state data is read once and written back with ``set_data``, because ``update_data`` would
+    read the data from the storage a second time before writing it.
+
+    Args:
+        state (FSMContext): The finite state machine context holding the selected categories.
+        category_id (int): The ID of the selected category.
+        category_name (str): The name of the selected category.
+    """
+    state_data = await state.get_data()
+    select_category(state_data, category_id, category_name)
+    await state.set_data(state_data)
+
+
+def select_category(state_data: dict[str, Any], category_id: int, category_name: str) -> None:
+    """Add a category to the selected categories held by the state data, without writing it to the storage.
+
+    The selected categories are kept under their own ``statistics_categories`` key as a list of
+    ``[category_id, category_name]`` pairs, because JSON would turn the integer keys of a dict into strings
+    that have to be cast back on every read.
+
+    Args:
+        state_data (dict[str, Any]): The state data holding the selected categories, changed in place.
+        category_id (int): The ID of the selected category.
+        category_name (str): The name of the selected category.
+    """
+    categories = _get_selected_categories(state_data)
+    if all(selected_category_id != category_id for selected_category_id, _ in categories):
+        categories.append((category_id, category_name))
+    state_data["statistics_categories"] = categories
+
+
+def _get_selected_categories(state_data: dict[str, Any]) -> list[tuple[int, str]]:
+    """Return the categories selected for the statistics as ``[category_id, category_name]`` pairs.
+
+    Sessions started before the selection got its own key hold it under ``categories`` as a dict with
+    string keys, which is converted. Anything that is not a ``[category_id, category_name]`` pair is
+    dropped, so a stale value or a value of another flow never breaks the selection.
+
+    Args:
+        state_data (dict[str, Any]): The state data holding the selected categories.
+
+    Returns:
+        list[tuple[int, str]]: The selected categories, an empty list if there are none.
+    """
+    categories = state_data.get("statistics_categories")
+    legacy_categories = state_data.get("categories")
+    if categories is None and isinstance(legacy_categories, dict):
+        categories = [
+            (int(category_id), category_name)
+            for category_id, category_name in legacy_categories.items()
+            if str(category_id).lstrip("-").isdigit()
+        ]
+    if not isinstance(categories, list):
+        return []
+    selected_categories: list[tuple[int, str]] = []
+    for category in categories:
+        # JSON storage returns the pairs as lists, the memory storage keeps the tuples
+        if not (isinstance(category, list | tuple) and len(category) == 2):  # noqa: PLR2004
+            continue
+        category_id, category_name = category
+        if isinstance(category_id, int) and isinstance(category_name, str):
+            selected_categories.append((category_id, category_name))
+    return selected_categories
+
+
+async def get_selected_category_or_send_error(
+    callback_query: types.CallbackQuery,
+    message: types.Message,
+    state: FSMContext,
+    i18n: I18nContext,
+    all_categories_name: str,
+) -> tuple[int, str] | None:
+    """Resolve the category of a pressed category button and answer with the matching error if it is not valid.
+
+    Both statistics menus need the same checks: the callback must have data and sender information,
+    and its data must hold the ID of the all categories pseudo category or of an existing user category.
+
+    Args:
+        callback_query (types.CallbackQuery): The callback query of the pressed category button.
+        message (types.Message): The message with the inline keyboard the callback came from.
+        state (FSMContext): The finite state machine context for managing user state.
+        i18n (I18nContext): The internationalization context for retrieving localized strings.
+        all_categories_name (str): The name shown for the all categories pseudo category.
+
+    Returns:
+        tuple[int, str] | None: The ID and the name of the selected category, or None if an error was sent.
+    """
+    if not (callback_query.data and callback_query.from_user):
+        await handle_error_situation(
+            message=message,
+            state=state,
+            i18n=i18n,
+            answer_key="ERROR_USER_INFO",
+            ensure_safe_exit=ensure_safe_exit,
+        )
+        return None
+    try:
+        category_id = SelectedCategory.unpack_category_id(callback_query.data)
+    except ValueError:
+        # no category has the ID 0, so the malformed data is answered below like an unknown category
+        category_id = 0
+    if category_id == ALL_CATEGORIES_ID:
+        return category_id, all_categories_name
+    category_name = await get_category_name(callback_query.from_user.id, category_id)
+    if not (category_name and category_id):
+        await handle_error_situation(
+            message=message,
+            state=state,
+            i18n=i18n,
+            answer_key="ERROR_UNKNOWN",
+            ensure_safe_exit=ensure_safe_exit,
+        )
+        return None
+    return category_id, category_name
+
+
+async def turn_categories_page(
+    callback_query: types.CallbackQuery,
+    message: types.Message,
+    state: FSMContext,
+    i18n: I18nContext,
+    categories_choose_pages_navigation: NavigationCallbackData,
+    end_categories_select_callback_data: str,
+) -> None:
+    """Show the previous or the next page of the categories list, depending on the pressed navigation button.
+
+    The page wraps around: the next page after the last one is the first one and vice versa.
+
+    Args:
+        callback_query (types.CallbackQuery): The callback query of the pressed navigation button.
+        message (types.Message): The message with the navigation buttons.
+        state (FSMContext): The finite state machine context for managing user states.
+        i18n (I18nContext): The internationalization context for handling translations.
+        categories_choose_pages_navigation (NavigationCallbackData):
+            Callback data for navigating between pages of categories.
+
+        end_categories_select_callback_data (str):
+            Callback data to be used when the category selection process ends.
+    """
+    # it takes user_id from callback query, not message, because user_id from message is nonsense
+    user_id = callback_query.from_user.id
+    total_pages = await get_categories_total_pages(user_id)
+    if total_pages <= 1:
+        # a single page has nowhere to turn, rendering it again would not change the message
+        return
+    # the state data is read once and written back whole, update_data would read it a second time
+    state_data = await state.get_data()
+    current_page = _get_turned_page(
+        callback_data=callback_query.data,
+        current_page=state_data.get("current_page_choose_category") or 0,
+        last_page=total_pages - 1,
+        navigation_callback_data=categories_choose_pages_navigation,
+    )
+    state_data["current_page_choose_category"] = current_page
+    await state.set_data(state_data)
+    await handle_categories_list(
+        user_id=user_id,
+        message=message,
+        page=current_page,
+        i18n=i18n,
+        categories_choose_pages_navigation=categories_choose_pages_navigation,
+        end_categories_select_callback_data=end_categories_select_callback_data,
+    )
+
+
+async def turn_statistics_page(
+    callback_query: types.CallbackQuery,
+    message: types.Message,
+    state: FSMContext,
+    i18n: I18nContext,
+    statistics_navigation_callback_data: NavigationCallbackData,
+) -> None:
+    """Show the previous or the next statistics page, depending on the pressed navigation button.
+
+    The page wraps around: the next page after the last one is the first one and vice versa.
+    Clicks on the same message within PAGE_TURN_DEBOUNCE_DELAY seconds are coalesced: the first
+    click waits for the delay, the following ones only add their step, and the message is edited
+    once with the page all of them lead to.
+
+    Args:
+        callback_query (types.CallbackQuery): The callback query of the pressed navigation button.
+        message (types.Message): The message with the navigation buttons.
+        state (FSMContext): The finite state machine context for storing and retrieving user-specific data.
+        i18n (I18nContext): The internationalization context for retrieving localized strings.
+        statistics_navigation_callback_data (NavigationCallbackData): Callback data
+            used for navigation between statistical pages.
+    """
+    page_step = _get_page_step(callback_query.data, statistics_navigation_callback_data)
+    page_turn_key = (message.chat.id, message.message_id)
+    if page_turn_key in _pending_page_turns:
+        _pending_page_turns[page_turn_key] += page_step
+        return
+    _pending_page_turns[page_turn_key] = page_step
+    try:
+        await asyncio.sleep(PAGE_TURN_DEBOUNCE_DELAY)
+    finally:
+        page_steps = _pending_page_turns.pop(page_turn_key)
+    # the state data is read once and written back whole, update_data would read it a second time
+    state_data = await state.get_data()
+    statististics_pages = _statistics_pages.get(page_turn_key)
+    if statististics_pages is None:
+        # the pages are kept by send_statistics, they are generated again after a restart or for older messages
+        # it takes user_id from callback query, not message, because user_id from message is nonsense
+        statististics_pages = await get_statistics_pages(
+            callback_query.from_user.id,
+            message,
+            state,
+            i18n,
+            state_data=state_data,
+        )
+        if statististics_pages:
+            _store_statistics_pages(message, statististics_pages)
+    if not statististics_pages:
+        await handle_error_situation(
+            message=message,
+            state=state,
+            i18n=i18n,
+            answer_key="ERROR_NO_STATISTICS",
+            ensure_safe_exit=ensure_safe_exit,
+        )
+        return
+    if page_steps % len(statististics_pages) == 0:
+        # the clicks cancel each other out or there is a single page, the message would not change
+        return
+    current_page = (state_data.get("current_page_category_expenses") or 0) + page_steps
+    current_page %= len(statististics_pages)
+    state_data["current_page_category_expenses"] = current_page
+    state_data.pop("statistics_pages", None)
+    await state.set_data(state_data)
+    await message.edit_text(
+        text=statististics_pages[current_page],
+        reply_markup=get_navigation_inline_keyboard_markup(
+            page=current_page,
+            total_pages=len(statististics_pages),
+            navigation_callback_data=statistics_navigation_callback_data,
+        ),
+    )
+
+
+def parse_period_date(text: str) -> date | None:
+    """Parse a custom period date entered by the user in the ``DD.MM.YYYY`` format.
+
+    It accepts the same input as ``datetime.strptime(text, "%d.%m.%Y")`` (one or two digit day and month,
+    four digit year) but only splits the text and builds the date directly, without interpreting the format
+    string on every message.
+
+    Args:
+        text (str): The text entered by the user.
+
+    Returns:
+        date | None: The parsed date, or None if the text is not a valid date in the expected format.
+    """
+    parts = text.split(".")
+    if len(parts) != 3:  # noqa: PLR2004
+        return None
+    day, month, year = parts
+    if not (0 < len(day) <= 2 and 0 < len(month) <= 2 and len(year) == 4):  # noqa: PLR2004
+        return None
+    digits = day + month + year
+    if not (digits.isascii() and digits.isdigit()):
+        return None
+    try:
+        return date(int(year), int(month), int(day))
+    except ValueError:
+        return None
+
+
 async def get_statistics_pages(
     user_id: int,
     message: types.Message,
     state: FSMContext,
     i18n: I18nContext,
+    state_data: dict[str, Any] | None = None,
 ) -> list[str] | None:
     """Generate statistics pages based on user input and state data.
 
@@ -251,6 +581,8 @@ async def get_statistics_pages(
         message (types.Message): The message object from the user.
         state (FSMContext): The finite state machine context containing user session data.
         i18n (I18nContext): The internationalization context for localized messages.
+        state_data (dict[str, Any] | None, optional): The state data already read by the caller.
+            If None, the state data is read from the storage.
 
     Returns:
         list[str] | None: A list of strings representing the statistics pages, or None if an error occurs.
@@ -258,33 +590,25 @@ async def get_statistics_pages(
     Raises:
         StatisticsNotGeneratedError: If the statistics could not be generated.
     """
-    state_data = await state.get_data()
+    if state_data is None:
+        state_data = await state.get_data()
     period = state_data.get("period")
     custom_period_start_date = state_data.get("custom_period_start_date", None)
     custom_period_end_date = state_data.get("custom_period_end_date", None)
-    categories = state_data.get("categories", {})
+    categories = _get_selected_categories(state_data)
 
     if not categories:
         await handle_error_situation(
             message=message,
             state=state,
             i18n=i18n,
-            answer_text=i18n.get("ERROR_NO_CATEGORIES_SELECTED"),
+            answer_key="ERROR_NO_CATEGORIES_SELECTED",
             ensure_safe_exit=ensure_safe_exit,
         )
         return None
 
-    start_date = (
-        datetime.strptime(custom_period_start_date, "%d.%m.%Y").date()  # noqa: DTZ007
-        if custom_period_start_date
-        else None
-    )
-    end_date = (
-        datetime.strptime(custom_period_end_date, "%d.%m.%Y").date()  # noqa: DTZ007
-        if custom_period_end_date
-        else None
-    )
-    categories = {int(category_id): category_name for category_id, category_name in categories.items()}
+    start_date = _get_stored_period_date(custom_period_start_date)
+    end_date = _get_stored_period_date(custom_period_end_date)
     try:
         return await _generate_statistics_text(
             user_id=user_id,
@@ -293,7 +617,7 @@ async def get_statistics_pages(
                 period=period,
                 custom_period_start_date=start_date,
                 custom_period_end_date=end_date,
-                categories=categories,
+                categories=dict(categories),
             ),
         )
     except StatisticsNotGeneratedError:
@@ -332,26 +656,27 @@ async def _generate_statistics_text(
     else:
         custom_period = None
 
-    expenses = await get_expenses_by_category_ids_by_period(
+    category_currency_sums = await get_category_currency_sums_by_period(
         user_id,
-        list(statistics_config.categories.keys()),
+        statistics_config.categories.keys(),
         period=expense_period,
         custom_period=custom_period,
     )
-    if not expenses:
+    if not category_currency_sums:
         raise StatisticsNotGeneratedError("No expenses found for the specified period.")
-    return _generate_statistics_message_pages(expenses, statistics_config, i18n)
+    return _generate_statistics_message_pages(category_currency_sums, statistics_config, i18n)
 
 
 def _generate_statistics_message_pages(
-    expenses: dict[int, list[Expense]],
+    category_currency_sums: dict[int, dict[str, Decimal]],
     statistics_config: StatisticsConfig,
     i18n: I18nContext,
 ) -> list[str]:
     """Generate a list of statistics pages for the user.
 
     Args:
-        expenses (dict[int, list[Expense]]): A dictionary mapping category IDs to lists of expenses.
+        category_currency_sums (dict[int, dict[str, Decimal]]): A dictionary mapping category IDs
+            to the sums of their expenses per currency.
         statistics_config (StatisticsConfig): The statistics configuration to generate the statistics for.
         i18n (I18nContext): The internationalization context for localizing text.
 
@@ -359,40 +684,37 @@ def _generate_statistics_message_pages(
         list[str]: A list of strings containing the statistics message pages.
     """
     statistics_pages = []
-    for category_id, category_expenses in expenses.items():
+    for category_id, currency_sums in category_currency_sums.items():
         category_name = statistics_config.categories.get(category_id)
         if not category_name:
             continue
-        statistics_page = _generate_statistics_page(category_expenses, category_name, i18n)
+        statistics_page = _generate_statistics_page(currency_sums, category_name, i18n)
         statistics_pages.append(statistics_page)
     return statistics_pages
 
 
-def _generate_statistics_page(expenses: list[Expense], category_name: str, i18n: I18nContext) -> str:
+def _generate_statistics_page(currency_sums: dict[str, Decimal], category_name: str, i18n: I18nContext) -> str:
     """Generate a statistics page for a single category.
 
     Args:
-        expenses (list[Expense]): A list of Expense objects to generate statistics for.
+        currency_sums (dict[str, Decimal]): The sums of the category expenses per currency.
         category_name (str): The name of the category to generate statistics for.
         i18n (I18nContext): The internationalization context for localizing text.
 
     Returns:
         str: A string containing the statistics message for the category.
     """
-    if not expenses:
+    if not currency_sums:
         return i18n.get("ERROR_NO_EXPENSES_PAGE_MESSAGE", category_name=category_name)
-    sums = defaultdict(float)
-    for expense in expenses:
-        # pyright doesnt understand the SQL Alchemy models types
-        sums[expense.currency] += expense.amount  # pyright: ignore[reportArgumentType]
-    expenses_message = "\n".join(
+    # join turns a generator into a list first anyway, so the list is built directly
+    expenses_message = "\n".join([
         i18n.get(
             "CUSTOM_STATISTICS_CURRENCY_SUM",
             amount=total,
             currency=currency,
         )
-        for currency, total in sums.items()
-    )
+        for currency, total in currency_sums.items()
+    ])
     return i18n.get(
         "CUSTOM_STATISTICS_PAGE",
         category_name=category_name,
@@ -400,6 +722,25 @@ def _generate_statistics_page(expenses: list[Expense], category_name: str, i18n:
     )
 
 
+def _get_stored_period_date(stored_date: object) -> date | None:
+    """Convert a custom period date stored in the state data back to a date.
+
+    The dates are stored as ordinals, parsed once when the user entered them. Sessions started before
+    that still hold the entered ``DD.MM.YYYY`` text, which is parsed instead.
+
+    Args:
+        stored_date (object): The value stored in the state data.
+
+    Returns:
+        date | None: The stored date, or None if no valid date is stored.
+    """
+    if isinstance(stored_date, int) and stored_date > 0:
+        return date.fromordinal(stored_date)
+    if isinstance(stored_date, str):
+        return parse_period_date(stored_date)
+    return None
+
+
 def _is_statistics_config_valid(statistics_config: StatisticsConfig) -> bool:
     """Check if the statistics configuration is valid.
 
@@ -409,13 +750,13 @@ def _is_statistics_config_valid(statistics_config: StatisticsConfig) -> bool:
     Returns:
         bool: True if the statistics configuration is valid, False otherwise.
     """
+    if not statistics_config.categories:
+        return False
     custom_period_valid = _is_custom_period_valid(
         statistics_config.custom_period_start_date,
         statistics_config.custom_period_end_date,
     )
-    if bool(statistics_config.period) == custom_period_valid:
-        return False
-    return bool(statistics_config.categories)
+    return bool(statistics_config.period) != custom_period_valid
 
 
 def _is_custom_period_valid(start_date: date | None, end_date: date | None) -> bool:
@@ -435,6 +776,39 @@ def _is_custom_period_valid(start_date: date | None, end_date: date | None) -> b
     return start_date <= end_date
 
 
+def _get_turned_page(
+    callback_data: str | None,
+    current_page: int,
+    last_page: int,
+    navigation_callback_data: NavigationCallbackData,
+) -> int:
+    """Return the page a navigation button leads to, wrapping around at both ends.
+
+    Args:
+        callback_data (str | None): The callback data of the pressed navigation button.
+        current_page (int): The currently shown page.
+        last_page (int): The index of the last page.
+        navigation_callback_data (NavigationCallbackData): The callback data of the navigation buttons.
+
+    Returns:
+        int: The next page for the "next page" button, the previous page otherwise.
+    """
+    return (current_page + _get_page_step(callback_data, navigation_callback_data)) % (last_page + 1)
+
+
+def _get_page_step(callback_data: str | None, navigation_callback_data: NavigationCallbackData) -> int:
+    """Return how many pages a navigation button turns.
+
+    Args:
+        callback_data (str | None): The callback data of the pressed navigation button.
+        navigation_callback_data (NavigationCallbackData): The callback data of the navigation buttons.
+
+    Returns:
+        int: 1 for the "next page" button, -1 otherwise.
+    """
+    return 1 if callback_data == navigation_callback_data.next_page else -1
+
+
 def _get_expense_period_from_callback_data(period: str) -> ExpensePeriod | None:
     """Convert a string representation of an expense period into an ExpensePeriod enum instance.
 
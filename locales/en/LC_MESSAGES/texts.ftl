@@ -35,6 +35,14 @@ ERROR_DATE_NOT_VALID =
     Unfortunately, the entered date is not valid.  
     Please try again in DD.MM.YYYY format.
 
+ERROR_CATEGORY_NAME_NOT_VALID = 
+    Unfortunately, the entered category name is too long.  
+    Please enter a name no longer than { $max_length } characters.
+
+ERROR_TOO_MANY_CATEGORIES = 
+    Unfortunately, no more than { $max_categories } categories can be entered at once.  
+    To finish input, press the button below.
+
 # NOT GOTTEN ERROR
 ERROR_CURRENCY = Error: Failed to retrieve selected currency.
 
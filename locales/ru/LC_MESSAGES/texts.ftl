@@ -35,6 +35,14 @@ ERROR_DATE_NOT_VALID =
     К сожалению, введенная дата не является валидной.
     Пожалуйста, повторите попытку в формате ДД.ММ.ГГГГ.
 
+ERROR_CATEGORY_NAME_NOT_VALID = 
+    К сожалению, введенное название категории слишком длинное.
+    Пожалуйста, введите название не длиннее { $max_length } символов.
+
+ERROR_TOO_MANY_CATEGORIES = 
+    К сожалению, за один раз можно ввести не более { $max_categories } категорий.
+    Чтобы закончить ввод, нажмите на кнопку ниже.
+
 # NOT GOTTEN ERROR
 ERROR_CURRENCY = Ошибка: не удалось получить выбранную валюту.
 
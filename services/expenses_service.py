@@ -1,13 +1,32 @@
 """Module contains the business logic for the expenses service."""
-from collections import defaultdict
+import time
+from collections.abc import Collection, Iterable
 from datetime import date, timedelta
+from decimal import Decimal
 from enum import Enum
+from itertools import groupby
+from operator import itemgetter
 
 from dateutil.relativedelta import relativedelta
 
 from database.crud import expenses as expenses_crud
-from database.exceptions import CategoryNotFoundError, ExpenseNotFoundError, UserConfigNotFoundError, UserNotFoundError
-from database.models import Expense
+from database.exceptions import CategoryNotFoundError, UserConfigNotFoundError, UserNotFoundError
+
+CURRENCIES_CACHE_TTL = 300
+CURRENCIES_CACHE_SIZE = 10_000
+STATISTICS_CACHE_TTL = 60
+STATISTICS_CACHE_SIZE = 1024
+
+# Maps a Telegram ID to the currencies used in the user's expenses and the moment they were fetched,
+# least recently fetched users first.
+_currencies_cache: dict[int, tuple[list[str] | None, float]] = {}
+# Maps a Telegram ID to the category currency sums computed for the user, keyed by the selected
+# categories and the start and end dates of the period, together with the moment they were computed.
+# The least recently computed users come first.
+_statistics_cache: dict[
+    int,
+    dict[tuple[frozenset[int], date, date], tuple[dict[int, dict[str, Decimal]] | None, float]],
+] = {}
 
 
 class ExpenseNotAddedError(Exception):
@@ -59,11 +78,41 @@ async def add_expense(name: str, currency: str, amount: float, user_tg_id: int,
         await expenses_crud.add_expense(name, currency, amount, date.today(), user_tg_id, category_id)
     except (UserNotFoundError, UserConfigNotFoundError, CategoryNotFoundError) as exception:
         raise ExpenseNotAddedError("Expenses not added to DB") from exception
+    finally:
+        drop_cached_currencies(user_tg_id)
+        drop_cached_statistics(user_tg_id)
+
+
+def drop_cached_currencies(tg_id: int) -> None:
+    """Forget the cached currencies of a user, so that they are fetched again on the next request.
+
+    Must be called whenever expenses are added or removed for the user, including when a category
+    is removed together with its expenses.
+
+    Args:
+        tg_id (int): The Telegram ID of the user.
+    """
+    _currencies_cache.pop(tg_id, None)
+
+
+def drop_cached_statistics(tg_id: int) -> None:
+    """Forget the cached statistics sums of a user, so that they are computed again on the next request.
+
+    Must be called whenever the user's expenses change, including when a category is removed
+    together with its expenses.
+
+    Args:
+        tg_id (int): The Telegram ID of the user.
+    """
+    _statistics_cache.pop(tg_id, None)
 
 
 async def get_all_currencies_used_by_tg_id(tg_id: int) -> list[str] | None:
     """Retrieve all currencies used in expenses by a user based on their Telegram ID.
 
+    The currencies are cached per user for CURRENCIES_CACHE_TTL seconds, for at most CURRENCIES_CACHE_SIZE
+    users. The cache entry is dropped whenever the user's expenses are added or removed.
+
     Args:
         tg_id (int): The Telegram ID of the user.
 
@@ -73,36 +122,46 @@ async def get_all_currencies_used_by_tg_id(tg_id: int) -> list[str] | None:
     Raises:
         UserNotFoundError: If the user is not found.
     """
+    cached_currencies = _currencies_cache.get(tg_id)
+    if cached_currencies and time.monotonic() - cached_currencies[1] < CURRENCIES_CACHE_TTL:
+        return cached_currencies[0]
     try:
-        return await expenses_crud.get_all_currencies_used_by_tg_id(tg_id)
+        currencies = await expenses_crud.get_all_currencies_used_by_tg_id(tg_id)
     except UserNotFoundError:
         return None
+    # the entry is moved to the end, so the first entry is always the least recently fetched one
+    _currencies_cache.pop(tg_id, None)
+    _currencies_cache[tg_id] = (currencies, time.monotonic())
+    if len(_currencies_cache) > CURRENCIES_CACHE_SIZE:
+        del _currencies_cache[next(iter(_currencies_cache))]  # noqa: WPS420
+    return currencies
 
 
-async def get_expenses_by_category_ids_by_period(
+async def get_category_currency_sums_by_period(
     tg_id: int,
-    category_ids: list[int],
+    category_ids: Collection[int],
     period: ExpensePeriod | None = None,
     custom_period: CustomPeriod | None = None,
-) -> dict[int, list[Expense]] | None:
-    """Retrieve expenses grouped by category IDs for a given user within a specified period.
+) -> dict[int, dict[str, Decimal]] | None:
+    """Retrieve the sums of a user's expenses per currency for the given categories within a specified period.
 
-    This function fetches all expenses for a user identified by their Telegram ID (`tg_id`),
-    filters them by a specified period (either a predefined `ExpensePeriod` or a custom
-    `CustomPeriod`), and groups the filtered expenses by their category IDs.
+    The expenses are summed by the database grouped by category and currency, so only the sums are
+    loaded instead of every expense of the user. The sums of the ALL_CATEGORIES_ID pseudo category
+    are rolled up from the sums of the user's categories. The result is cached per user for
+    STATISTICS_CACHE_TTL seconds, until the user's expenses change, for at most STATISTICS_CACHE_SIZE users.
 
     Args:
-        tg_id (int): The Telegram ID of the user whose expenses are being retrieved.
-        category_ids (list[int]): A list of category IDs to group the expenses by.
+        tg_id (int): The Telegram ID of the user whose expenses are being summed.
+        category_ids (Collection[int]): The IDs of the categories to sum the expenses of.
         period (ExpensePeriod | None, optional): A predefined period to filter expenses.
             If not provided, `custom_period` must be specified.
         custom_period (CustomPeriod | None, optional): A custom period to filter expenses.
             If not provided, `period` must be specified.
 
     Returns:
-        dict[int, list[Expense]] | None: A dictionary where the keys are category IDs
-            and the values are lists of `Expense` objects for that category. Returns
-            `None` if no period is specified or if no expenses are found.
+        dict[int, dict[str, Decimal]] | None: A dictionary where the keys are category IDs and the values
+            map currencies to the sums of the category expenses in them. Returns `None` if no period
+            is specified or if no expenses are found.
 
     Note:
         Either `period` or `custom_period` must be provided. If both are `None`, the
@@ -115,13 +174,85 @@ async def get_expenses_by_category_ids_by_period(
         custom_period = _get_period(period)
         if not custom_period:
             return None
-    try:
-        expenses = await expenses_crud.get_all_expenses_by_tg_id(tg_id)
-    except ExpenseNotFoundError:
+    start_date, end_date = custom_period
+    selected_category_ids = frozenset(category_ids)
+    cache_key = (selected_category_ids, start_date, end_date)
+    cached_sums = _statistics_cache.get(tg_id, {}).get(cache_key)
+    if cached_sums and time.monotonic() - cached_sums[1] < STATISTICS_CACHE_TTL:
+        return cached_sums[0]
+    grouped_sums = await _fetch_category_currency_sums(tg_id, selected_category_ids, custom_period)
+    now = time.monotonic()
+    # Expired entries of the user are dropped here, so that the cache does not grow with every new period.
+    user_statistics_cache = {
+        key: cached_entry
+        for key, cached_entry in _statistics_cache.get(tg_id, {}).items()
+        if now - cached_entry[1] < STATISTICS_CACHE_TTL
+    }
+    user_statistics_cache[cache_key] = (grouped_sums, now)
+    # the user is moved to the end, so the users who stopped asking for statistics are forgotten first
+    _statistics_cache.pop(tg_id, None)
+    _statistics_cache[tg_id] = user_statistics_cache
+    if len(_statistics_cache) > STATISTICS_CACHE_SIZE:
+        del _statistics_cache[next(iter(_statistics_cache))]  # noqa: WPS420
+    return grouped_sums
+
+
+async def _fetch_category_currency_sums(
+    tg_id: int,
+    category_ids: frozenset[int],
+    custom_period: CustomPeriod,
+) -> dict[int, dict[str, Decimal]] | None:
+    """Sum a user's expenses per category and currency within a period and group the sums by category.
+
+    Args:
+        tg_id (int): The Telegram ID of the user whose expenses are being summed.
+        category_ids (frozenset[int]): The IDs of the categories to sum the expenses of.
+        custom_period (CustomPeriod): The start and end dates of the period.
+
+    Returns:
+        dict[int, dict[str, Decimal]] | None: A dictionary where the keys are category IDs and the values
+            map currencies to the sums of the category expenses in them, or `None` if no expenses are found.
+    """
+    start_date, end_date = custom_period
+    all_categories_selected = ALL_CATEGORIES_ID in category_ids
+    category_currency_sums = await expenses_crud.get_category_currency_sums_by_tg_id(
+        tg_id,
+        start_date,
+        end_date,
+        category_ids=None if all_categories_selected else category_ids,
+    )
+    if not category_currency_sums:
         return None
 
-    filtered_expenses_by_period = _filter_expenses_by_period(expenses, custom_period)
-    return _filter_expenses_by_category_ids(filtered_expenses_by_period, category_ids)
+    # The sums arrive ordered by category, so the rows of a category are adjacent.
+    category_sums = {
+        category_id: {currency: total for _, currency, total in category_rows}
+        for category_id, category_rows in groupby(category_currency_sums, key=itemgetter(0))
+    }
+    grouped_sums = {
+        category_id: currency_sums
+        for category_id, currency_sums in category_sums.items()
+        if category_id in category_ids
+    }
+    if all_categories_selected:
+        grouped_sums[ALL_CATEGORIES_ID] = _add_up_currency_sums(category_sums.values())
+    return grouped_sums
+
+
+def _add_up_currency_sums(categories_currency_sums: Iterable[dict[str, Decimal]]) -> dict[str, Decimal]:
+    """Add up the per currency sums of several categories into the per currency sums of all of them.
+
+    Args:
+        categories_currency_sums (Iterable[dict[str, Decimal]]): The sums of every category per currency.
+
+    Returns:
+        dict[str, Decimal]: The total sums per currency.
+    """
+    total_sums: dict[str, Decimal] = {}
+    for currency_sums in categories_currency_sums:
+        for currency, total in currency_sums.items():
+            total_sums[currency] = total_sums.get(currency, Decimal(0)) + total
+    return total_sums
 
 
 def _get_period(period: ExpensePeriod | None) -> CustomPeriod | None:
@@ -144,49 +275,6 @@ def _get_period(period: ExpensePeriod | None) -> CustomPeriod | None:
     return (start_date, date.today())
 
 
-def _filter_expenses_by_period(expenses: list[Expense], period: CustomPeriod) -> list[Expense]:
-    """Filter a list of expenses to include only those that fall within a specified date range.
-
-    Args:
-        expenses (list[Expense]): A list of Expense objects to be filtered.
-        period (CustomPeriod): A tuple containing the start and end dates (start_date, end_date)
-            that define the filtering period.
-
-    Returns:
-        list[Expense]: A list of Expense objects that have a date within the specified period.
-    """
-    start_date, end_date = period
-    # It works, pyright doesn't understand SQLALCHEMY objects
-    return [
-        expense
-        for expense in expenses
-        if start_date <= expense.date <= end_date  # pyright: ignore[reportGeneralTypeIssues]
-    ]
-
-
-def _filter_expenses_by_category_ids(
-    expenses: list[Expense],
-    category_ids: list[int],
-) -> dict[int, list[Expense]]:
-    """Filter and group a list of expenses by their category IDs.
-
-    Args:
-        expenses (list[Expense]): A list of Expense objects to be filtered.
-        category_ids (list[int]): A list of category IDs to filter the expenses by.
-
-    Returns:
-        dict[int, list[Expense]]: A dictionary where the keys are category IDs
-        and the values are lists of Expense objects that belong to those categories.
-    """
-    grouped_expenses = defaultdict(list)
-    for expense in expenses:
-        if expense.category_id in category_ids:
-            grouped_expenses[expense.category_id].append(expense)
-        if ALL_CATEGORIES_ID in category_ids:
-            grouped_expenses[ALL_CATEGORIES_ID].append(expense)
-    return dict(grouped_expenses)
-
-
 # no, here so many returns is okay, because they have the same simple logic.
 def _get_start_date(period: ExpensePeriod) -> date | None:  # noqa: WPS212
     """Calculate the start date based on the given expense period.
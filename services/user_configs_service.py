@@ -1,10 +1,19 @@
 """Services for user configuration operations."""
+import asyncio
+import time
+
 from database.crud import categories as categories_crud
 from database.crud import user_configs as user_configs_crud
 from database.exceptions import CategoryNotFoundError, UserConfigNotFoundError, UserNotFoundError
+from services import expenses_service
 
 type CategoryData = tuple[str, int]
 
+CATEGORIES_CACHE_TTL = 30
+
+# Maps a Telegram ID to the task loading the user's categories and the moment it was started.
+_categories_cache: dict[int, tuple[asyncio.Task[list[CategoryData] | None], float]] = {}
+
 
 class UserConfigNotChangedError(Exception):
     """Raised when a user configuration is not changed."""
@@ -113,12 +122,16 @@ async def add_user_expenses_categories(tg_id: int, categories: list[str]) -> Non
     Raises:
         UserConfigNotChangedError: If the user configuration is not changed.
     """
+    # the cache is dropped around the write, so no categories loaded before it are served afterwards
+    _categories_cache.pop(tg_id, None)
     try:
         await categories_crud.add_user_categories(tg_id, categories)
     except UserNotFoundError as exception:
         raise UserConfigNotChangedError("User not found") from exception
     except UserConfigNotFoundError as exception:
         raise UserConfigNotChangedError("User config not found") from exception
+    finally:
+        _categories_cache.pop(tg_id, None)
 
 
 async def remove_user_expenses_category(tg_id: int, category_id: int) -> None:
@@ -131,28 +144,59 @@ async def remove_user_expenses_category(tg_id: int, category_id: int) -> None:
     Raises:
         UserConfigNotChangedError: If the user configuration is not changed.
     """
+    _categories_cache.pop(tg_id, None)
     try:
         await categories_crud.remove_user_category_by_id(tg_id, category_id)
     except (UserNotFoundError, UserConfigNotFoundError, CategoryNotFoundError) as exception:
         raise UserConfigNotChangedError("User not found") from exception
     except Exception as exception:
         raise UserConfigNotChangedError("Unknown error") from exception
+    finally:
+        _categories_cache.pop(tg_id, None)
+        # The expenses of the category are removed together with it.
+        expenses_service.drop_cached_currencies(tg_id)
+        expenses_service.drop_cached_statistics(tg_id)
 
 
 async def get_user_expenses_categories(tg_id: int) -> list[CategoryData] | None:
     """Fetch the expense categories for a user based on their Telegram ID.
 
+    The categories are cached per user for CATEGORIES_CACHE_TTL seconds, and concurrent calls for the
+    same user share a single database query. Missing or empty categories are not cached. The cache entry
+    is dropped whenever the user's categories are added or removed through this module.
+
     Args:
         tg_id (int): The Telegram ID of the user.
 
     Returns:
         list[CategoryData] | None: A list of CategoryData tuples containing the category name and ID,
         or None if the user or categories are not found.
+    """
+    cached_categories = _categories_cache.get(tg_id)
+    if cached_categories and time.monotonic() - cached_categories[1] < CATEGORIES_CACHE_TTL:
+        categories_task = cached_categories[0]
+    else:
+        categories_task = asyncio.ensure_future(_fetch_user_expenses_categories(tg_id))
+        _categories_cache[tg_id] = (categories_task, time.monotonic())
+    try:
+        user_categories = await asyncio.shield(categories_task)
+    except Exception:
+        _drop_cached_categories(tg_id, categories_task)
+        raise
+    if not user_categories:
+        _drop_cached_categories(tg_id, categories_task)
+    return user_categories
 
-    Raises:
-        UserNotFoundError: If the user is not found.
-        UserConfigNotFoundError: If the user configuration is not found.
-        CategoryNotFoundError: If the categories are not found.
+
+async def _fetch_user_expenses_categories(tg_id: int) -> list[CategoryData] | None:
+    """Fetch the expense categories for a user from the database.
+
+    Args:
+        tg_id (int): The Telegram ID of the user.
+
+    Returns:
+        list[CategoryData] | None: A list of CategoryData tuples containing the category name and ID,
+        or None if the user or categories are not found.
     """
     try:
         user_categories = await categories_crud.get_user_categories_by_tg_id(tg_id)
@@ -162,3 +206,15 @@ async def get_user_expenses_categories(tg_id: int) -> list[CategoryData] | None:
         (str(category.name), int(category.id))  # pyright: ignore[reportArgumentType]
         for category in user_categories
     ]
+
+
+def _drop_cached_categories(tg_id: int, categories_task: asyncio.Task[list[CategoryData] | None]) -> None:
+    """Remove the cached categories of a user if they still belong to the given task.
+
+    Args:
+        tg_id (int): The Telegram ID of the user.
+        categories_task (asyncio.Task[list[CategoryData] | None]): The task whose result should not be cached.
+    """
+    cached_categories = _categories_cache.get(tg_id)
+    if cached_categories and cached_categories[0] is categories_task:
+        del _categories_cache[tg_id]  # noqa: WPS420
@@ -0,0 +1,119 @@
+"""Module provides a bot session middleware that keeps outgoing messages within Telegram rate limits.
+
+Telegram allows a bot to send about 30 messages per second in total and about one message per second
+to the same chat, with short bursts tolerated. Messages exceeding these limits are rejected with
+"429 Too Many Requests", so the middleware spaces out the messages instead of letting them fail and be retried.
+
+Attributes:
+    TELEGRAM_GLOBAL_MESSAGES_PER_SECOND (int): How many messages Telegram lets a bot send per second in total.
+    GLOBAL_REQUESTS_INTERVAL (float): Minimum interval in seconds between any two sent messages.
+    CHAT_REQUESTS_INTERVAL (float): Interval in seconds in which a chat regains one message of its burst.
+    CHAT_BURST_SIZE (int): How many messages can be sent to a chat at once before they are spaced out.
+    MAXIMUM_RETRIES (int): How many times a request rejected with "retry after" is sent again.
+    CHAT_SLOTS_PRUNE_THRESHOLD (int): Number of tracked chats after which the idle ones are forgotten.
+    UNLIMITED_SEND_METHODS (frozenset[str]): Send methods that do not count as messages.
+"""
+import asyncio
+
+from aiogram import Bot
+from aiogram.client.session.middlewares.base import BaseRequestMiddleware, NextRequestMiddlewareType
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import Response, TelegramMethod
+from aiogram.methods.base import TelegramType
+
+TELEGRAM_GLOBAL_MESSAGES_PER_SECOND = 30
+GLOBAL_REQUESTS_INTERVAL = 1 / TELEGRAM_GLOBAL_MESSAGES_PER_SECOND
+CHAT_REQUESTS_INTERVAL = 1.0
+CHAT_BURST_SIZE = 3
+MAXIMUM_RETRIES = 3
+CHAT_SLOTS_PRUNE_THRESHOLD = 10000
+UNLIMITED_SEND_METHODS = frozenset(("sendChatAction",))
+
+
+class RateLimitRequestMiddleware(BaseRequestMiddleware):
+    """Request middleware that delays sent messages so that they do not exceed Telegram rate limits.
+
+    Only the ``send*`` methods addressed to a chat are limited; edits, deletions, chat actions and
+    answers to callback queries are sent immediately. Every chat has a token bucket of CHAT_BURST_SIZE
+    messages that refills one message per CHAT_REQUESTS_INTERVAL. Once a message may be sent to its chat,
+    it reserves the next free slot of the global schedule, so the global slots are taken in the order
+    the messages are really sent. A message rejected with "retry after" anyway is sent again after
+    the requested delay.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty global and per chat schedules."""
+        self._next_global_slot = float(0)
+        # Maps a chat to the moment its bucket is full again, the bucket being empty CHAT_BURST_SIZE
+        # intervals before it.
+        self._chat_buckets_full_at: dict[int | str, float] = {}
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: Bot,
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        """Send the request once its chat is allowed to receive another message.
+
+        Args:
+            make_request (NextRequestMiddlewareType[TelegramType]): The next step of the request chain.
+            bot (Bot): The bot sending the request.
+            method (TelegramMethod[TelegramType]): The Telegram API method being called.
+
+        Returns:
+            Response[TelegramType]: The response of the Telegram API.
+        """
+        chat_id: int | str | None = getattr(method, "chat_id", None)
+        if chat_id is None or not _is_limited_method(method):
+            return await make_request(bot, method)
+        await self._wait_for_chat_slot(chat_id)
+        await self._wait_for_global_slot()
+        # the retries have to wait for each other, every one of them is sent after the previous one is rejected
+        for _ in range(MAXIMUM_RETRIES):
+            try:
+                return await make_request(bot, method)  # noqa: WPS476
+            except TelegramRetryAfter as exception:
+                await asyncio.sleep(exception.retry_after)  # noqa: WPS476
+        return await make_request(bot, method)
+
+    async def _wait_for_chat_slot(self, chat_id: int | str) -> None:
+        """Take a message from the chat bucket, sleeping until the bucket has one if it is empty.
+
+        Args:
+            chat_id (int | str): The chat the message is addressed to.
+        """
+        now = asyncio.get_running_loop().time()
+        if len(self._chat_buckets_full_at) >= CHAT_SLOTS_PRUNE_THRESHOLD:
+            self._chat_buckets_full_at = {
+                tracked_chat_id: full_at
+                for tracked_chat_id, full_at in self._chat_buckets_full_at.items()
+                if full_at > now
+            }
+        bucket_full_at = max(now, self._chat_buckets_full_at.get(chat_id, now))
+        # the message may be sent once the bucket holds at least one message
+        send_at = max(now, bucket_full_at - (CHAT_BURST_SIZE - 1) * CHAT_REQUESTS_INTERVAL)
+        self._chat_buckets_full_at[chat_id] = bucket_full_at + CHAT_REQUESTS_INTERVAL
+        if send_at > now:
+            await asyncio.sleep(send_at - now)
+
+    async def _wait_for_global_slot(self) -> None:
+        """Reserve the next free global slot and sleep until it comes."""
+        now = asyncio.get_running_loop().time()
+        global_slot = max(now, self._next_global_slot)
+        self._next_global_slot = global_slot + GLOBAL_REQUESTS_INTERVAL
+        if global_slot > now:
+            await asyncio.sleep(global_slot - now)
+
+
+def _is_limited_method(method: TelegramMethod[TelegramType]) -> bool:
+    """Check whether a method sends a message and therefore counts towards the rate limits.
+
+    Args:
+        method (TelegramMethod[TelegramType]): The Telegram API method being called.
+
+    Returns:
+        bool: True for the ``send*`` methods except the ones in UNLIMITED_SEND_METHODS, False otherwise.
+    """
+    api_method = method.__api_method__
+    return api_method.startswith("send") and api_method not in UNLIMITED_SEND_METHODS